@@ -4,12 +4,104 @@ Handles continuous buffering of chat messages and searching for identifiers
 """
 
 import pytchat
+import re
+import sys
+from bisect import bisect_left, bisect_right, insort
 from collections import deque
+from functools import lru_cache
+from itertools import accumulate
+from typing import NamedTuple
 from threading import Thread, Lock, Event
-from datetime import datetime
 import time
 
 
+# Chat fetch polling (seconds)
+DEFAULT_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 2.0
+
+
+@lru_cache(maxsize=32)
+def _compile_identifiers(identifiers: tuple):
+    """
+    Compile one alternation pattern matching any of the identifiers
+
+    Args:
+        identifiers: Tuple of literal identifiers
+
+    Returns:
+        Compiled regex pattern
+    """
+    # Longest first so a shorter identifier never shadows a longer one
+    ordered = sorted(identifiers, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(i) for i in ordered))
+
+
+def _next_poll_interval(fetched: int, interval: float) -> float:
+    """
+    Pick the sleep before the next chat fetch based on the last batch size
+
+    Args:
+        fetched: Number of messages returned by the last fetch
+        interval: Interval used before the last fetch (seconds)
+
+    Returns:
+        Interval to wait before the next fetch (seconds)
+    """
+    if fetched == 0:
+        # Quiet chat - back off gradually to save wakeups
+        return min(interval * 1.5, MAX_POLL_INTERVAL)
+    if fetched < 5:
+        # Trickle of messages - stay responsive
+        return 0.25
+    if fetched >= 20:
+        # Steady stream - let larger batches accumulate
+        return 1.0
+    return DEFAULT_POLL_INTERVAL
+
+
+class ChatMessage(NamedTuple):
+    """
+    A buffered chat message
+
+    Immutable, so search results can share records with the buffer.
+    """
+    author: str  # Display name without leading @
+    author_lower: str  # Casefolded author, used as the index key
+    message: str
+    timestamp: float  # Epoch seconds, formatted only for display
+
+
+_tuple_new = tuple.__new__
+_intern = sys.intern
+
+
+def _make_record(author_name: str, message: str, timestamp: float) -> ChatMessage:
+    """
+    Build a buffered message record
+
+    The casefolded author name (so "Straße" matches "STRASSE") is
+    computed once here so username searches don't have to fold every
+    buffered message. Both names are interned: chat authors repeat
+    heavily, so each distinct name is stored once and index lookups can
+    short-circuit on identity.
+
+    Args:
+        author_name: Author display name (without leading @)
+        message: Message text
+        timestamp: Epoch seconds, formatted only for display
+
+    Returns:
+        ChatMessage record
+    """
+    # tuple.__new__ skips the generated NamedTuple.__new__ wrapper
+    return _tuple_new(ChatMessage, (
+        _intern(author_name),
+        _intern(author_name.casefold()),
+        message,
+        timestamp
+    ))
+
+
 class YouTubeChatBuffer:
     """
     Buffers YouTube livestream chat messages and provides search functionality
@@ -24,13 +116,22 @@ class YouTubeChatBuffer:
         """
         self.video_id = video_id
         self.chat = None
-        self.buffer = deque()  # Unlimited buffer - keeps all messages during session
+        # Unlimited buffer - keeps all messages during session. Messages are
+        # never evicted, so a fixed-capacity ring would only cap the session;
+        # deque appends are already O(1) with block-level allocation.
+        self.buffer = deque()
+        self.by_author = {}  # author_lower -> list of ChatMessage (same objects as buffer)
+        self.authors = []  # Sorted by_author keys, for prefix lookups
         self.buffer_lock = Lock()
         self.worker_thread = None
         self.stop_flag = Event()
         self.stream_ended_flag = Event()
         self.error_message = None
-        self.first_message_time = None
+        self.first_message_time = None  # time.monotonic() of first buffered message
+        self.message_count = 0  # Kept in step with buffer for lock-free stats
+        self._bulk_cache = ('', [0])  # (joined message text, offsets) for bulk search
+        self._bulk_cache_ci = ('', [0])  # Same, of the casefolded text
+        self.stats_callback = None  # Called with get_buffer_stats() when stats change
 
     def start_buffering(self, chat_object=None) -> bool:
         """
@@ -78,29 +179,33 @@ class YouTubeChatBuffer:
         reconnect_attempts = 0
         max_reconnect_attempts = 3
         backoff_time = 1.0
-
-        while not self.stop_flag.is_set():
+        poll_interval = DEFAULT_POLL_INTERVAL
+        # first_message_time is set once; a local flag keeps the attribute
+        # check out of the per-message path
+        first_stored = self.first_message_time is not None
+
+        # Bind hot lookups to locals once for the life of the thread
+        now = time.time
+        make_record = _make_record
+        store = self._store
+        stop_flag = self.stop_flag
+
+        while not stop_flag.is_set():
             try:
                 if self.chat and self.chat.is_alive():
-                    # Fetch new messages
+                    # Fetch new messages, building each record outside the
+                    # lock. sync_items() is a generator that sleeps between
+                    # items to replay the chat's timing, so each message is
+                    # stored as soon as it is yielded: a search must see it
+                    # without waiting for the rest of the fetch window.
+                    fetched = 0
                     for message in self.chat.get().sync_items():
-                        # Create message dict
+                        if not first_stored:
+                            self.first_message_time = time.monotonic()
+                            first_stored = True
                         # Strip @ from username if present
-                        author_name = message.author.name
-                        if author_name.startswith('@'):
-                            author_name = author_name[1:]
-
-                        msg_dict = {
-                            'author': author_name,
-                            'message': message.message,
-                            'timestamp': datetime.now()
-                        }
-
-                        # Add to buffer with lock
-                        with self.buffer_lock:
-                            self.buffer.append(msg_dict)
-                            if self.first_message_time is None:
-                                self.first_message_time = datetime.now()
+                        store(make_record(message.author.name.removeprefix('@'), message.message, now()))
+                        fetched += 1
 
                     # Reset reconnect counter on success
                     reconnect_attempts = 0
@@ -109,10 +214,13 @@ class YouTubeChatBuffer:
                 else:
                     # Stream has ended
                     self.stream_ended_flag.set()
+                    self._notify_stats()
                     break
 
-                # Sleep between fetches
-                time.sleep(0.5)
+                # Wait between fetches (returns early when stop is requested)
+                poll_interval = _next_poll_interval(fetched, poll_interval)
+                if stop_flag.wait(poll_interval):
+                    break
 
             except Exception as e:
                 # Handle connection errors with exponential backoff
@@ -120,7 +228,10 @@ class YouTubeChatBuffer:
 
                 if reconnect_attempts <= max_reconnect_attempts:
                     self.error_message = f"Connection error, retrying... ({reconnect_attempts}/{max_reconnect_attempts})"
-                    time.sleep(backoff_time)
+                    self._notify_stats()
+                    # Wait out the backoff (returns early when stop is requested)
+                    if stop_flag.wait(backoff_time):
+                        break
                     backoff_time *= 2  # Exponential backoff
 
                     # Cannot reconnect from background thread due to pytchat signal issues
@@ -128,8 +239,63 @@ class YouTubeChatBuffer:
                 else:
                     # Max retries exceeded
                     self.error_message = f"Connection lost after {max_reconnect_attempts} attempts"
+                    self._notify_stats()
                     break
 
+    def add_message(self, author_name: str, message: str):
+        """
+        Add a single chat message to the buffer
+
+        Args:
+            author_name: Author display name (without leading @)
+            message: Message text
+        """
+        if self.first_message_time is None:
+            self.first_message_time = time.monotonic()
+        self._store(_make_record(author_name, message, time.time()))
+
+    def _store(self, record: ChatMessage):
+        """
+        Append one message record to the buffer and author index
+
+        Args:
+            record: ChatMessage record built by _make_record
+        """
+        with self.buffer_lock:
+            self.buffer.append(record)
+            messages = self.by_author.get(record.author_lower)
+            if messages is None:
+                messages = self.by_author[record.author_lower] = []
+                insort(self.authors, record.author_lower)
+            messages.append(record)
+            self.message_count += 1
+
+        self._notify_stats()
+
+    def on_stats_change(self, callback):
+        """
+        Register a callback for buffer statistics changes
+
+        The callback runs on the buffering thread (or the caller of
+        add_message), so UI code must marshal it to its own thread.
+
+        Args:
+            callback: Called with the get_buffer_stats() dict when messages are
+                      added or the error/stream-ended state changes; None to remove
+        """
+        self.stats_callback = callback
+
+    def _notify_stats(self):
+        """Invoke the stats callback, if any, without letting it break the caller"""
+        callback = self.stats_callback
+        if callback is not None:
+            try:
+                callback(self.get_buffer_stats())
+            except Exception:
+                # A failing listener (e.g. window already closed) must not
+                # stop buffering
+                pass
+
     def search_buffer(self, identifier: str) -> list:
         """
         Search buffer for messages containing the identifier
@@ -138,19 +304,179 @@ class YouTubeChatBuffer:
             identifier: String to search for (case-sensitive, partial match)
 
         Returns:
-            List of matching message dicts with author and timestamp
+            List of matching ChatMessage records
+        """
+        # Snapshot under the lock so the scan doesn't block the worker thread
+        with self.buffer_lock:
+            snapshot = tuple(self.buffer)
+
+        # Case-sensitive partial string matching. `in` already runs CPython's
+        # fastsearch with its own skip table; a separate prefix probe measured
+        # slower because it adds a second pass over non-matching messages.
+        return [msg for msg in snapshot if identifier in msg.message]
+
+    def contains_identifier(self, identifier: str) -> bool:
+        """
+        Check whether any buffered message contains the identifier
+
+        Stops at the first hit, scanning newest messages first since a
+        freshly sent identifier is most likely near the end.
+
+        Args:
+            identifier: String to search for (case-sensitive, partial match)
+
+        Returns:
+            True if at least one message contains the identifier
+        """
+        with self.buffer_lock:
+            snapshot = tuple(self.buffer)
+
+        return any(identifier in msg.message for msg in reversed(snapshot))
+
+    def search_buffer_bulk(self, identifier: str) -> list:
+        """
+        Search buffer with one scan over the concatenated message text
+
+        Same results as search_buffer, but the per-message containment
+        tests are replaced by str.find over a single NUL-joined string,
+        which pays off on large buffers with few matches.
+
+        Args:
+            identifier: String to search for (case-sensitive, partial match)
+
+        Returns:
+            List of matching ChatMessage records
+        """
+        # NUL separators keep matches inside one message, unless the
+        # identifier itself contains NUL or is empty
+        if not identifier or '\x00' in identifier:
+            return self.search_buffer(identifier)
+
+        with self.buffer_lock:
+            snapshot = tuple(self.buffer)
+
+        joined, offsets = self._joined_messages(snapshot)
+        return self._find_in_joined(snapshot, joined, offsets, identifier)
+
+    def search_buffer_ci(self, identifier: str) -> list:
+        """
+        Search buffer for messages containing the identifier, ignoring case
+
+        Scans a cached casefolded join of the messages like
+        search_buffer_bulk; the identifier is casefolded once per call.
+
+        Args:
+            identifier: String to search for (case-insensitive, partial match)
+
+        Returns:
+            List of matching ChatMessage records
+        """
+        folded = identifier.casefold()
+
+        with self.buffer_lock:
+            snapshot = tuple(self.buffer)
+
+        if not folded or '\x00' in folded:
+            return [msg for msg in snapshot if folded in msg.message.casefold()]
+
+        joined, offsets = self._joined_messages(snapshot, casefold=True)
+        return self._find_in_joined(snapshot, joined, offsets, folded)
+
+    @staticmethod
+    def _find_in_joined(snapshot: tuple, joined: str, offsets: list, identifier: str) -> list:
+        """
+        Collect the messages of a snapshot whose joined text contains identifier
+
+        Args:
+            snapshot: Tuple of buffered ChatMessage records
+            joined: NUL-joined message text (see _joined_messages)
+            offsets: Message start offsets into joined
+            identifier: Non-empty string without NUL to find
+
+        Returns:
+            List of matching ChatMessage records, in buffer order
         """
         matches = []
+        hit = joined.find(identifier)
+        while hit != -1:
+            index = bisect_right(offsets, hit) - 1
+            if index >= len(snapshot):
+                # Cache was extended past our snapshot by a concurrent search
+                break
+            matches.append(snapshot[index])
+            # Resume at the next message so each message is reported once
+            hit = joined.find(identifier, offsets[index + 1])
+
+        return matches
 
+    def _joined_messages(self, snapshot: tuple, casefold: bool = False) -> tuple:
+        """
+        Get the NUL-joined text of a buffer snapshot and message offsets
+
+        The buffer is append-only, so the cached join is extended with
+        just the messages added since the last call.
+
+        Args:
+            snapshot: Tuple of buffered ChatMessage records
+            casefold: Join the casefolded message text (separate cache)
+
+        Returns:
+            (joined_text, offsets) where offsets[i] is the start of message i
+            and offsets[-1] is one past the end of the last message
+        """
+        joined, offsets = self._bulk_cache_ci if casefold else self._bulk_cache
+        cached_count = len(offsets) - 1
+
+        if cached_count < len(snapshot):
+            if casefold:
+                texts = [msg.message.casefold() for msg in snapshot[cached_count:]]
+            else:
+                texts = [msg.message for msg in snapshot[cached_count:]]
+            tail = '\x00'.join(texts)
+            joined = joined + '\x00' + tail if cached_count else tail
+            offsets = offsets + list(accumulate(
+                (len(text) + 1 for text in texts), initial=offsets[-1]
+            ))[1:]
+            if casefold:
+                self._bulk_cache_ci = (joined, offsets)
+            else:
+                self._bulk_cache = (joined, offsets)
+
+        return joined, offsets
+
+    def search_many(self, identifiers: list) -> dict:
+        """
+        Search buffer for messages containing any of several identifiers
+
+        The buffer is scanned once with a single compiled pattern; only
+        messages that hit the pattern are checked per identifier.
+
+        Args:
+            identifiers: Strings to search for (case-sensitive, partial match)
+
+        Returns:
+            Dict mapping each identifier to its list of matching ChatMessage records
+        """
+        identifiers = tuple(dict.fromkeys(identifiers))
+        matches = {identifier: [] for identifier in identifiers}
+        if not identifiers:
+            return matches
+
+        pattern = _compile_identifiers(identifiers)
+
+        # Snapshot under the lock so the scan doesn't block the worker thread
         with self.buffer_lock:
-            for msg in self.buffer:
-                # Case-sensitive partial string matching
-                if identifier in msg['message']:
-                    matches.append({
-                        'author': msg['author'],
-                        'message': msg['message'],
-                        'timestamp': msg['timestamp']
-                    })
+            snapshot = tuple(self.buffer)
+
+        for msg in snapshot:
+            text = msg.message
+            if pattern.search(text) is None:
+                continue
+
+            # A message may contain more than one identifier
+            for identifier in identifiers:
+                if identifier in text:
+                    matches[identifier].append(msg)
 
         return matches
 
@@ -162,22 +488,32 @@ class YouTubeChatBuffer:
             username: Username to search for (case-insensitive)
 
         Returns:
-            List of matching message dicts with message and timestamp
+            List of matching ChatMessage records, most recent first
         """
-        matches = []
-        username_lower = username.lower()
+        username_lower = username.strip().casefold()
 
         with self.buffer_lock:
-            for msg in self.buffer:
-                # Case-insensitive username matching
-                if msg['author'].lower() == username_lower:
-                    matches.append({
-                        'author': msg['author'],
-                        'message': msg['message'],
-                        'timestamp': msg['timestamp']
-                    })
+            # Case-insensitive lookup in the author index
+            return self.by_author.get(username_lower, [])[::-1]
 
-        return matches
+    def match_usernames(self, prefix: str) -> list:
+        """
+        Find buffered usernames starting with a prefix
+
+        Args:
+            prefix: Start of a username (case-insensitive)
+
+        Returns:
+            Sorted list of matching casefolded usernames
+        """
+        prefix = prefix.strip().casefold()
+
+        with self.buffer_lock:
+            authors = self.authors
+            start = bisect_left(authors, prefix)
+            # Every name with this prefix sorts before prefix + U+10FFFF
+            end = bisect_left(authors, prefix + '\U0010ffff', start)
+            return authors[start:end]
 
     def get_buffer_stats(self) -> dict:
         """
@@ -186,16 +522,15 @@ class YouTubeChatBuffer:
         Returns:
             Dict with message_count and time_span_seconds
         """
-        with self.buffer_lock:
-            message_count = len(self.buffer)
-
-            if self.first_message_time is not None:
-                time_span = (datetime.now() - self.first_message_time).total_seconds()
-            else:
-                time_span = 0.0
+        # Single attribute reads are atomic, so no lock is needed here
+        first_message_time = self.first_message_time
+        if first_message_time is not None:
+            time_span = time.monotonic() - first_message_time
+        else:
+            time_span = 0.0
 
         return {
-            'message_count': message_count,
+            'message_count': self.message_count,
             'time_span_seconds': time_span
         }
 
@@ -4,6 +4,76 @@ import customtkinter as ctk
 from theme import COLORS_DARK, FONTS, SPACING, DIMENSIONS
 
 
+# Shared widget styles, built once at import and merged with call-site kwargs.
+# Fonts are looked up per call: FONTS entries become CTkFont objects once
+# load_fonts() runs.
+_PRIMARY_BUTTON_STYLE = dict(
+    fg_color=COLORS_DARK['primary'],
+    hover_color=COLORS_DARK['primary_hover'],
+    text_color='white',
+    corner_radius=DIMENSIONS['corner_radius'],
+    height=DIMENSIONS['button_height'],
+)
+
+_SECONDARY_BUTTON_STYLE = dict(
+    fg_color='transparent',
+    hover_color=COLORS_DARK['bg_elevated'],
+    text_color=COLORS_DARK['primary'],
+    border_width=2,
+    border_color=COLORS_DARK['primary'],
+    corner_radius=DIMENSIONS['corner_radius'],
+    height=DIMENSIONS['button_height'],
+)
+
+# Text entry; call-site kwargs override these (e.g. a borderless entry)
+_ENTRY_STYLE = dict(
+    height=DIMENSIONS['input_height'],
+    fg_color=COLORS_DARK['bg_elevated'],
+    border_color=COLORS_DARK['border'],
+    text_color=COLORS_DARK['text_primary'],
+)
+
+# Label style name -> (FONTS key, text color)
+_LABEL_STYLES = {
+    'icon': ('display_icon', COLORS_DARK['text_primary']),
+    'title': ('h1', COLORS_DARK['text_primary']),
+    'title_success': ('h1', COLORS_DARK['success']),
+    'title_primary': ('h1', COLORS_DARK['primary']),
+    'prefix': ('h2', COLORS_DARK['text_tertiary']),
+    'body': ('body', COLORS_DARK['text_secondary']),
+    'body_sm': ('body_sm', COLORS_DARK['text_secondary']),
+    'caption': ('caption', COLORS_DARK['text_tertiary']),
+    'caption_primary': ('caption', COLORS_DARK['primary']),
+}
+
+# Bordered card frame; callers add fg_color/border_color as needed
+_CARD_STYLE = dict(
+    corner_radius=DIMENSIONS['corner_radius'],
+    border_width=1,
+)
+
+# InfoCallout color_scheme -> (background, border)
+_CALLOUT_COLORS = {
+    'warning': (COLORS_DARK['warning_bg'], COLORS_DARK['warning']),
+    'info': (COLORS_DARK['bg_surface'], COLORS_DARK['primary']),
+    'success': (COLORS_DARK['success_bg'], COLORS_DARK['success']),
+    'error': (COLORS_DARK['error_bg'], COLORS_DARK['error']),
+}
+_DEFAULT_CALLOUT_COLORS = (COLORS_DARK['bg_surface'], COLORS_DARK['border'])
+
+# Icons InfoCallout.configure_text recognizes as an existing prefix. Some are
+# two code points (base + variation selector), so match whole tokens.
+_CALLOUT_ICONS = frozenset(("💡", "ℹ️", "✅", "❌", "⚠️"))
+
+# MessageCard border_scheme -> border color
+_MESSAGE_CARD_BORDERS = {
+    'success': COLORS_DARK['success'],
+    'error': COLORS_DARK['error'],
+    'warning': COLORS_DARK['warning'],
+    'info': COLORS_DARK['primary'],
+}
+
+
 def create_primary_button(parent, text, command, **kwargs):
     """
     Create a primary action button with consistent styling.
@@ -21,12 +91,8 @@ def create_primary_button(parent, text, command, **kwargs):
         parent,
         text=text,
         command=command,
-        fg_color=COLORS_DARK['primary'],
-        hover_color=COLORS_DARK['primary_hover'],
-        text_color='white',
         font=FONTS['body'],
-        corner_radius=DIMENSIONS['corner_radius'],
-        height=DIMENSIONS['button_height'],
+        **_PRIMARY_BUTTON_STYLE,
         **kwargs
     )
 
@@ -48,18 +114,47 @@ def create_secondary_button(parent, text, command, **kwargs):
         parent,
         text=text,
         command=command,
-        fg_color='transparent',
-        hover_color=COLORS_DARK['bg_elevated'],
-        text_color=COLORS_DARK['primary'],
-        border_width=2,
-        border_color=COLORS_DARK['primary'],
         font=FONTS['body'],
-        corner_radius=DIMENSIONS['corner_radius'],
-        height=DIMENSIONS['button_height'],
+        **_SECONDARY_BUTTON_STYLE,
         **kwargs
     )
 
 
+def create_entry(parent, **kwargs):
+    """
+    Create a text entry with consistent styling.
+
+    Args:
+        parent: Parent widget
+        **kwargs: Additional CTkEntry parameters; these override the shared
+                  style (font, fg_color, border_width, etc.)
+
+    Returns:
+        CTkEntry: Configured entry
+    """
+    return ctk.CTkEntry(parent, **{'font': FONTS['body'], **_ENTRY_STYLE, **kwargs})
+
+
+def create_label(parent, text="", style="body", **kwargs):
+    """
+    Create a label in one of the shared text styles.
+
+    Args:
+        parent: Parent widget
+        text: Label text
+        style: Key of _LABEL_STYLES (e.g. "title", "body", "caption")
+        **kwargs: Additional CTkLabel parameters (override the style)
+
+    Returns:
+        CTkLabel widget
+    """
+    font_key, text_color = _LABEL_STYLES[style]
+    return ctk.CTkLabel(
+        parent,
+        **{'text': text, 'font': FONTS[font_key], 'text_color': text_color, **kwargs}
+    )
+
+
 class StatsCard:
     """
     Stats card component with large number and caption.
@@ -81,17 +176,20 @@ class StatsCard:
         self.frame = ctk.CTkFrame(
             parent,
             fg_color=COLORS_DARK['bg_surface'],
-            corner_radius=DIMENSIONS['corner_radius'],
-            border_width=1,
             border_color=COLORS_DARK['border'],
+            **_CARD_STYLE,
             **kwargs
         )
 
+        # Bound variables, so an update is a variable set, not a configure
+        self.count_var = ctk.StringVar(self.frame, value="0")
+        self.caption_var = ctk.StringVar(self.frame, value="messages buffered (0 seconds)")
+
         # Large number in primary color
         self.count_label = ctk.CTkLabel(
             self.frame,
-            text="0",
-            font=('Segoe UI', 24, 'bold'),
+            textvariable=self.count_var,
+            font=FONTS['stat'],
             text_color=COLORS_DARK['primary']
         )
         self.count_label.pack(pady=(SPACING['md'], SPACING['xs']))
@@ -99,7 +197,7 @@ class StatsCard:
         # Caption
         self.caption_label = ctk.CTkLabel(
             self.frame,
-            text="messages buffered (0 seconds)",
+            textvariable=self.caption_var,
             font=FONTS['body_sm'],
             text_color=COLORS_DARK['text_secondary']
         )
@@ -117,10 +215,8 @@ class StatsCard:
             count: Number of messages
             seconds: Time span in seconds
         """
-        self.count_label.configure(text=str(count))
-        self.caption_label.configure(
-            text=f"messages buffered ({seconds} seconds)"
-        )
+        self.count_var.set(str(count))
+        self.caption_var.set(f"messages buffered ({seconds} seconds)")
 
     def get_count_label(self):
         """Get the count label widget for direct access if needed."""
@@ -153,28 +249,13 @@ class InfoCallout:
             **kwargs: Additional CTkFrame parameters
         """
         # Select colors based on scheme
-        if color_scheme == "warning":
-            bg_color = COLORS_DARK['warning_bg']
-            border_color = COLORS_DARK['warning']
-        elif color_scheme == "info":
-            bg_color = COLORS_DARK['bg_surface']
-            border_color = COLORS_DARK['primary']
-        elif color_scheme == "success":
-            bg_color = COLORS_DARK['success_bg']
-            border_color = COLORS_DARK['success']
-        elif color_scheme == "error":
-            bg_color = COLORS_DARK['error_bg']
-            border_color = COLORS_DARK['error']
-        else:
-            bg_color = COLORS_DARK['bg_surface']
-            border_color = COLORS_DARK['border']
+        bg_color, border_color = _CALLOUT_COLORS.get(color_scheme, _DEFAULT_CALLOUT_COLORS)
 
         self.frame = ctk.CTkFrame(
             parent,
             fg_color=bg_color,
-            corner_radius=DIMENSIONS['corner_radius'],
-            border_width=1,
             border_color=border_color,
+            **_CARD_STYLE,
             **kwargs
         )
 
@@ -203,11 +284,10 @@ class InfoCallout:
         if icon is not None:
             self.content_label.configure(text=f"{icon} {text}")
         else:
-            # Keep existing icon if any
-            current_text = self.content_label.cget("text")
-            if current_text and len(current_text) > 0 and current_text[0] in "💡ℹ️✅❌⚠️":
-                icon_char = current_text[0]
-                self.content_label.configure(text=f"{icon_char} {text}")
+            # Keep existing icon if any (label text is "<icon> <text>")
+            current_icon, _, _ = self.content_label.cget("text").partition(" ")
+            if current_icon in _CALLOUT_ICONS:
+                self.content_label.configure(text=f"{current_icon} {text}")
             else:
                 self.content_label.configure(text=text)
 
@@ -232,23 +312,13 @@ class MessageCard:
             **kwargs: Additional CTkFrame parameters
         """
         # Select border color based on scheme
-        if border_scheme == "success":
-            border_color = COLORS_DARK['success']
-        elif border_scheme == "error":
-            border_color = COLORS_DARK['error']
-        elif border_scheme == "warning":
-            border_color = COLORS_DARK['warning']
-        elif border_scheme == "info":
-            border_color = COLORS_DARK['primary']
-        else:
-            border_color = COLORS_DARK['border']
+        border_color = _MESSAGE_CARD_BORDERS.get(border_scheme, COLORS_DARK['border'])
 
         self.frame = ctk.CTkFrame(
             parent,
             fg_color=COLORS_DARK['bg_surface'],
-            corner_radius=DIMENSIONS['corner_radius'],
-            border_width=1,
             border_color=border_color,
+            **_CARD_STYLE,
             **kwargs
         )
 
@@ -316,7 +386,7 @@ def create_countdown_screen(parent, icon="📡", title="Please Wait", info_text=
         icon: Emoji icon to display
         title: Screen title
         info_text: Informational text
-        countdown_label_var: Variable to store countdown label reference
+        countdown_label_var: Optional StringVar the countdown number is bound to
 
     Returns:
         tuple: (center_frame, countdown_label, countdown_text_label)
@@ -358,6 +428,7 @@ def create_countdown_screen(parent, icon="📡", title="Please Wait", info_text=
     countdown_label = ctk.CTkLabel(
         center_frame,
         text="0",
+        textvariable=countdown_label_var,
         font=FONTS['display'],
         text_color=COLORS_DARK['primary']
     )
@@ -110,6 +110,13 @@ RESULTS_FAIL_DETAILS = (
     "No messages from @{username}\n\n"
     "Checked {count} messages over {seconds} seconds"
 )
+RESULTS_FAIL_REASONS = (
+    "Possible reasons:\n"
+    "• Messages may be shadowbanned\n"
+    "• Username might be misspelled\n"
+    "• User hasn't sent messages during buffer period\n"
+    "• Messages were deleted by moderators"
+)
 
 # Buttons
 RESULTS_BUTTON_SEARCH_AGAIN = "Search Again"
@@ -41,6 +41,7 @@ COLORS_DARK = {
 FONTS = {
     'display_icon': ('Segoe UI', 48, 'normal'),  # 📡✅❌
     'display': ('Segoe UI', 36, 'bold'),         # Countdown
+    'stat': ('Segoe UI', 24, 'bold'),            # Stats card number
     'h1': ('Segoe UI', 18, 'bold'),              # Step titles
     'h2': ('Segoe UI', 14, 'bold'),              # Section headers
     'body': ('Segoe UI', 13, 'normal'),          # Body text
@@ -48,6 +49,21 @@ FONTS = {
     'caption': ('Segoe UI', 10, 'normal'),       # Captions
 }
 
+
+def load_fonts():
+    """
+    Replace the FONTS tuples with shared CTkFont objects
+
+    Widgets given a tuple each resolve their own font; sharing one CTkFont
+    per entry resolves it once. Needs a root window, so call it after the
+    CTk root is created and before building widgets. Safe to call again.
+    """
+    for name, font in FONTS.items():
+        if isinstance(font, tuple):
+            family, size, weight = font
+            FONTS[name] = ctk.CTkFont(family=family, size=size, weight=weight)
+
+
 # Spacing constants
 SPACING = {
     'xs': 4,
@@ -1,21 +1,31 @@
 """
 User Interface for yt-shadowban-detector
 Redesigned step-by-step wizard interface
+
+Performance note: this module is GUI-bound, not compute-bound. Its costs are
+Tk round-trips, widget creation and anything that blocks the main loop, so
+JIT compilation (e.g. Numba) is a non-goal here. If message scanning ever
+becomes hot, that work belongs in chat_engine's search methods.
 """
 
 import sys
 import os
+import time
+from math import ceil
 import customtkinter as ctk
 from tkinter import messagebox
 from threading import Thread
-from datetime import datetime
-from url_validator import parse_youtube_url, validate_livestream
-from chat_engine import YouTubeChatBuffer
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from queue import SimpleQueue, Empty
+from url_validator import parse_youtube_url, validate_livestream_async
 import strings as S
-from theme import COLORS_DARK, FONTS, SPACING, DIMENSIONS
+from theme import COLORS_DARK, FONTS, SPACING, DIMENSIONS, load_fonts
 from components import (
     create_primary_button,
     create_secondary_button,
+    create_entry,
+    create_label,
     StatsCard,
     InfoCallout,
     MessageCard,
@@ -25,6 +35,24 @@ from components import (
 )
 
 
+# Chat modules, bound by _load_chat_modules() on first use
+pytchat = None
+YouTubeChatBuffer = None
+
+
+def _load_chat_modules():
+    """
+    Import pytchat and the chat engine, binding them as module globals
+
+    pytchat (and httpx behind it) takes a noticeable time to import, so it is
+    kept off the startup path and loaded while the intro screen is showing.
+    Later connections then only read the globals.
+    """
+    global pytchat, YouTubeChatBuffer
+    import pytchat
+    from chat_engine import YouTubeChatBuffer
+
+
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller
@@ -39,6 +67,22 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+@lru_cache(maxsize=256)
+def format_clock_time(timestamp):
+    """
+    Format a message timestamp for display
+
+    Cached, since searching again usually shows the same messages.
+
+    Args:
+        timestamp: Epoch seconds
+
+    Returns:
+        Local time as HH:MM:SS
+    """
+    return time.strftime("%H:%M:%S", time.localtime(timestamp))
+
+
 # UI States (Step-by-step flow)
 STATE_STEP0_INTRO = 0
 STATE_STEP1_URL = 1
@@ -48,6 +92,34 @@ STATE_STEP3_SEND_MESSAGE = 4
 STATE_STEP4_SEARCHING = 5
 STATE_STEP5_RESULTS = 6
 
+# Page keys for the two countdown screens (not states of their own)
+PAGE_BUFFER_DELAY = 'buffer_delay'
+PAGE_SEARCH_DELAY = 'search_delay'
+
+# Countdown screens: page key -> (step label, title, info text, seconds caption)
+DELAY_SCREENS = {
+    PAGE_BUFFER_DELAY: (
+        "", "Preparing Detection", "Initializing chat buffer...",
+        S.BUFFER_DELAY_SECONDS_REMAINING
+    ),
+    PAGE_SEARCH_DELAY: (
+        S.SEARCH_DELAY_LABEL, "Preparing Search", "Ensuring sufficient buffer data...",
+        S.SEARCH_DELAY_SECONDS_REMAINING
+    ),
+}
+
+# URL status (dot color, label color) pairs, resolved once at import.
+# (Fonts are not hoisted: load_fonts() replaces the FONTS entries at startup.)
+_STATUS_IDLE = (COLORS_DARK['text_tertiary'], COLORS_DARK['text_tertiary'])
+_STATUS_ERR = (COLORS_DARK['error'], COLORS_DARK['error'])
+_STATUS_WARN = (COLORS_DARK['warning'], COLORS_DARK['primary'])
+_STATUS_OK = (COLORS_DARK['success'], COLORS_DARK['success'])
+
+# Quiet period after the last URL keystroke before validating
+URL_DEBOUNCE_MS = 500
+
+# Intro text depends only on constants, so it is formatted once
+INTRO_TEXT = S.STEP0_INTRO_TEXT.format(total_steps=S.TOTAL_STEPS)
 
 
 
@@ -56,6 +128,17 @@ class Application:
     Main application window with step-by-step wizard interface
     """
 
+    # State -> name of the method that enters it
+    _STATE_ENTRIES = {
+        STATE_STEP0_INTRO: '_enter_step0_intro',
+        STATE_STEP1_URL: '_enter_step1_url',
+        STATE_CONNECTING: '_enter_connecting',
+        STATE_STEP2_MONITORING: '_enter_step2_monitoring',
+        STATE_STEP3_SEND_MESSAGE: '_enter_step3_send_message',
+        STATE_STEP4_SEARCHING: '_enter_step4_searching',
+        STATE_STEP5_RESULTS: '_enter_step5_results',
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("yt-shadowban-detector")  # Text-only window title
@@ -78,9 +161,21 @@ class Application:
 
         # State management
         self.current_state = STATE_STEP1_URL
+        self._pending_state = None  # Set by _set_state until the switch runs
         self.chat_buffer = None
         self.validation_after_id = None
+        self._validation_seq = 0  # Bumped per request; stale results are dropped
+        self._search_seq = 0  # Same for username searches
+        self._last_parsed = ("", None)  # (stripped URL, video id) of the last parse
+        self._last_url_text = ""  # Entry text at the last change event
+        self._last_url_edit = 0.0  # time.monotonic() of the last URL edit
+        self._last_username_text = ""
         self.stats_after_id = None
+        self._last_stats_key = None  # (count, seconds) last rendered
+        self._active_stats_view = None  # Renders (count, seconds) on the shown step
+        self._stats_events = SimpleQueue()  # Stats pushed from the buffering thread
+        self._stats_drain_pending = False
+        self._reported_problem = None  # Last stream error/end message shown
         self.username = None
         self.video_id = None
         self.last_search_results = None
@@ -91,73 +186,141 @@ class Application:
         self.search_delay = 8  # Seconds to wait before entering username
         self.delay_timer_id = None
 
+        # One reusable background thread for searches and buffer shutdown
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-worker")
+
         # Build UI
         self._build_ui()
 
         # Set initial state
         self._set_state(STATE_STEP0_INTRO)
 
+        # Warm up the chat modules and later pages before the user needs them
+        Thread(target=_load_chat_modules, daemon=True).start()
+        self.root.after(200, self._prebuild_pages)
+
     def _build_ui(self):
         """
         Build all UI components
         """
+        # Share one font object per FONTS entry across all widgets
+        load_fonts()
+
+        # Text of the labels updated while a step is showing
+        self.countdown_var = ctk.StringVar(value="0")
+        self.buffer_var = ctk.StringVar(value=S.STEP3_BUFFER_LOADING)
+        self.stream_problem_var = ctk.StringVar(value="")
+
+        # (banner, widget it is packed before) on each page that shows stats
+        self._problem_banners = []
+
         # Main container with padding
-        main_frame = ctk.CTkFrame(self.root, fg_color=COLORS_DARK['bg_app'])
-        main_frame.pack(fill="both", expand=True, padx=SPACING['lg'], pady=SPACING['lg'])
+        self.main_frame = ctk.CTkFrame(self.root, fg_color=COLORS_DARK['bg_app'])
+        self.main_frame.pack(fill="both", expand=True, padx=SPACING['lg'], pady=SPACING['lg'])
 
         # Step indicator
-        self.step_label = ctk.CTkLabel(
-            main_frame,
+        self.step_label = create_label(
+            self.main_frame,
             text="Step 1",
-            font=FONTS['caption'],
-            text_color=COLORS_DARK['text_tertiary']
+            style="caption"
         )
         self.step_label.pack(anchor="e", padx=(0, SPACING['md']), pady=(SPACING['md'], SPACING['sm']))
 
-        # Content frame (this changes based on state)
-        self.content_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        # Content frame (holds one page per step)
+        self.content_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         self.content_frame.pack(fill="both", expand=True)
 
-        # We'll build different content for each step dynamically
+        # Pages are built on first visit, then hidden and re-shown
+        self._pages = {}
+        self._current_page = None
 
-    def _clear_content(self):
-        """Clear all widgets from content frame"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def _get_page(self, key, builder):
+        """
+        Get the (page, refs) pair for key, building the page if needed
+
+        Args:
+            key: Page key (a STATE_* constant or PAGE_* name)
+            builder: Called once with the new page frame to create its widgets
+
+        Returns:
+            Tuple of (page frame, whatever builder returned)
+        """
+        if key not in self._pages:
+            page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+            self._pages[key] = (page, builder(page))
+        return self._pages[key]
+
+    def _prebuild_pages(self):
+        """
+        Build the remaining step pages without showing them
 
-    def _build_step0_intro(self):
-        """Build Step 0: Introduction screen"""
+        Runs shortly after the intro is on screen, so later steps appear
+        without first building their widgets. Unmapped pages need no
+        geometry passes until they are packed.
+        """
+        for key, builder in (
+            (STATE_STEP1_URL, self._create_step1_url),
+            (STATE_CONNECTING, self._create_connecting),
+            (PAGE_BUFFER_DELAY, partial(self._create_delay_screen, key=PAGE_BUFFER_DELAY)),
+            (STATE_STEP2_MONITORING, self._create_step2_monitoring),
+            (PAGE_SEARCH_DELAY, partial(self._create_delay_screen, key=PAGE_SEARCH_DELAY)),
+            (STATE_STEP3_SEND_MESSAGE, self._create_step3_send_message),
+            (STATE_STEP4_SEARCHING, self._create_step4_searching),
+        ):
+            self._get_page(key, builder)
+
+    def _show_page(self, key, builder):
+        """
+        Show the page for key, building it on first use
+
+        Args:
+            key: Page key (a STATE_* constant or PAGE_* name)
+            builder: Called once with the new page frame to create its widgets
+
+        Returns:
+            Whatever builder returned when the page was created
+        """
+        page, refs = self._get_page(key, builder)
+        if page is not self._current_page:
+            if self._current_page is not None:
+                self._current_page.pack_forget()
+            page.pack(fill="both", expand=True)
+            self._current_page = page
+
+        return refs
+
+    def _enter_step0_intro(self):
+        """Show Step 0: Introduction screen"""
         self.step_label.configure(text=S.STEP0_LABEL)
+        self._show_page(STATE_STEP0_INTRO, self._create_step0_intro)
 
+    def _create_step0_intro(self, parent):
+        """Create Step 0 widgets"""
         # Center container
-        center_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        center_frame = ctk.CTkFrame(parent, fg_color="transparent")
         center_frame.pack(expand=True, fill="both")
 
         # 📡 Satellite emoji (48pt)
-        icon = ctk.CTkLabel(
+        icon = create_label(
             center_frame,
             text="📡",
-            font=FONTS['display_icon'],
-            text_color=COLORS_DARK['text_primary']
+            style="icon"
         )
         icon.pack(pady=(SPACING['2xl'], SPACING['sm']))
 
         # Title
-        title = ctk.CTkLabel(
+        title = create_label(
             center_frame,
             text="Detect YouTube Chat Shadowbans",
-            font=FONTS['h1'],
-            text_color=COLORS_DARK['text_primary']
+            style="title"
         )
         title.pack(pady=(0, SPACING['md']))
 
         # Description text
-        intro_text = S.STEP0_INTRO_TEXT.format(total_steps=S.TOTAL_STEPS)
-        intro_label = ctk.CTkLabel(
+        intro_label = create_label(
             center_frame,
-            text=intro_text,
-            text_color=COLORS_DARK['text_secondary'],
-            font=FONTS['body_sm'],
+            text=INTRO_TEXT,
+            style="body_sm",
             wraplength=450,
             justify="center"
         )
@@ -173,35 +336,61 @@ class Application:
 
     def _set_state(self, state):
         """
-        Set UI state and rebuild interface for that step
+        Set UI state; the page for that step is shown once Tk is idle
+
+        Deferring lets the current event handler finish so the page switch
+        is laid out in one pass. Several calls before then collapse into
+        the last one.
+
+        Args:
+            state: One of the STATE_* constants
+        """
+        if self._pending_state is None:
+            self.root.after_idle(self._apply_pending_state)
+        self._pending_state = state
+
+    def _apply_pending_state(self):
+        """Show the page for the most recently requested state"""
+        state = self._pending_state
+        if state is None:
+            return  # Superseded by a delay screen (see _show_delay_screen)
+        self._pending_state = None
+        self._enter_state(state)
+
+    def _enter_state(self, state):
+        """
+        Make state current: show its (cached) page and refresh what changes per visit
+
+        Each _enter_* method shows its page, building it only on first use,
+        and reconfigures the few widgets whose content depends on the visit.
 
         Args:
             state: One of the STATE_* constants
         """
         self.current_state = state
-        self._clear_content()
-
-        if state == STATE_STEP0_INTRO:
-            self._build_step0_intro()
-        elif state == STATE_STEP1_URL:
-            self._build_step1_url()
-        elif state == STATE_CONNECTING:
-            self._build_connecting()
-        elif state == STATE_STEP2_MONITORING:
-            self._build_step2_monitoring()
-        elif state == STATE_STEP3_SEND_MESSAGE:
-            self._build_step3_send_message()
-        elif state == STATE_STEP4_SEARCHING:
-            self._build_step4_searching()
-        elif state == STATE_STEP5_RESULTS:
-            self._build_step5_results()
-
-    def _build_step1_url(self):
-        """Build Step 1: Enter URL"""
+        self._active_stats_view = None  # Set again by steps that show stats
+        self._cancel_timers()
+
+        entry = self._STATE_ENTRIES.get(state)
+        if entry:
+            getattr(self, entry)()
+
+    def _enter_step1_url(self):
+        """Show Step 1: Enter URL (reset to an empty entry)"""
         self.step_label.configure(text=S.STEP1_LABEL)
+        self._show_page(STATE_STEP1_URL, self._create_step1_url)
+        self._validation_seq += 1
+
+        self.url_entry.delete(0, "end")
+        self._last_url_text = ""
+        self.url_icon_label.configure(text="")
+        self.start_button.configure(state="disabled")
+        self._set_status(_STATUS_IDLE, S.STEP1_HINT)
 
+    def _create_step1_url(self, parent):
+        """Create Step 1 widgets"""
         # Center container
-        center_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        center_frame = ctk.CTkFrame(parent, fg_color="transparent")
         center_frame.pack(expand=True, fill="both", pady=SPACING['xl'])
 
         # 📡 Icon + Title
@@ -216,13 +405,8 @@ class Application:
         url_frame = ctk.CTkFrame(center_frame, fg_color="transparent")
         url_frame.pack(fill="x", padx=SPACING['xl'], pady=(0, SPACING['sm']))
 
-        self.url_entry = ctk.CTkEntry(
+        self.url_entry = create_entry(
             url_frame,
-            font=FONTS['body'],
-            height=DIMENSIONS['input_height'],
-            fg_color=COLORS_DARK['bg_elevated'],
-            border_color=COLORS_DARK['border'],
-            text_color=COLORS_DARK['text_primary'],
             placeholder_text="https://www.youtube.com/watch?v=..."
         )
         self.url_entry.pack(side="left", fill="x", expand=True)
@@ -254,89 +438,97 @@ class Application:
         self.start_button.pack(pady=SPACING['sm'])
 
         # Help text
-        help_text = ctk.CTkLabel(
+        help_text = create_label(
             center_frame,
             text="Paste the URL of an active YouTube livestream",
-            text_color=COLORS_DARK['text_tertiary'],
-            font=FONTS['caption']
+            style="caption"
         )
         help_text.pack(pady=(SPACING['xs'], 0))
 
-    def _build_connecting(self):
-        """Build connecting screen"""
+    def _enter_connecting(self):
+        """Show connecting screen"""
         self.step_label.configure(text="")
+        self._show_page(STATE_CONNECTING, self._create_connecting)
 
+    def _create_connecting(self, parent):
+        """Create connecting screen widgets"""
         # Connecting message
-        msg = ctk.CTkLabel(
-            self.content_frame,
+        msg = create_label(
+            parent,
             text=S.CONNECTING_TITLE,
-            font=FONTS['h1'],
-            text_color=COLORS_DARK['text_primary']
+            style="title"
         )
         msg.pack(pady=100)
 
-        status = ctk.CTkLabel(
-            self.content_frame,
+        status = create_label(
+            parent,
             text=S.CONNECTING_STATUS,
-            text_color=COLORS_DARK['text_secondary'],
-            font=FONTS['body']
+            style="body"
         )
         status.pack()
 
-    def _show_buffer_delay_screen(self):
-        """Show waiting screen while buffering initializes"""
-        self._clear_content()
-        self.step_label.configure(text="")
-
-        _, self.countdown_label, self.countdown_text = create_countdown_screen(
-            self.content_frame,
-            icon="📡",
-            title="Preparing Detection",
-            info_text="Initializing chat buffer..."
-        )
-
-        # Update countdown text to match expected string
-        self.countdown_text.configure(text=S.BUFFER_DELAY_SECONDS_REMAINING)
-        self.countdown_label.configure(text="8")
-
-    def _show_search_delay_screen(self):
-        """Show waiting screen before entering username"""
-        self._clear_content()
-        self.step_label.configure(text=S.SEARCH_DELAY_LABEL)
+    def _show_delay_screen(self, key, seconds, callback):
+        """
+        Show a countdown screen and start its countdown
 
-        _, self.countdown_label, self.countdown_text = create_countdown_screen(
-            self.content_frame,
+        Args:
+            key: PAGE_* key of an entry in DELAY_SCREENS
+            seconds: Countdown length
+            callback: Called when the countdown reaches zero
+        """
+        # Delay screens are shown directly, not through _set_state, so drop
+        # any deferred state change that would otherwise replace this page
+        # and cancel the countdown once Tk is idle
+        self._pending_state = None
+
+        self.step_label.configure(text=DELAY_SCREENS[key][0])
+        self._show_page(key, partial(self._create_delay_screen, key=key))
+        self._start_countdown(seconds, callback)
+
+    def _create_delay_screen(self, parent, key):
+        """Create countdown screen widgets from the DELAY_SCREENS entry for key"""
+        _, title, info_text, seconds_text = DELAY_SCREENS[key]
+        _, _, countdown_text = create_countdown_screen(
+            parent,
             icon="📡",
-            title="Preparing Search",
-            info_text="Ensuring sufficient buffer data..."
+            title=title,
+            info_text=info_text,
+            countdown_label_var=self.countdown_var
         )
 
         # Update countdown text to match expected string
-        self.countdown_text.configure(text=S.SEARCH_DELAY_SECONDS_REMAINING)
-        self.countdown_label.configure(text="8")
+        countdown_text.configure(text=seconds_text)
 
-    def _build_step2_monitoring(self):
-        """Build Step 2: Monitoring active"""
+    def _enter_step2_monitoring(self):
+        """Show Step 2: Monitoring active"""
         self.step_label.configure(text=S.STEP2_LABEL)
+        self._show_page(STATE_STEP2_MONITORING, self._create_step2_monitoring)
+        self.stats_card.update_stats(count=0, seconds=0)
+        self._last_stats_key = None
+        self._active_stats_view = self.stats_card.update_stats
+
+        # Start updating buffer stats
+        self._update_buffer_stats()
 
+    def _create_step2_monitoring(self, parent):
+        """Create Step 2 widgets"""
         # Center container
-        center_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        center_frame = ctk.CTkFrame(parent, fg_color="transparent")
         center_frame.pack(expand=True, fill="both", pady=SPACING['lg'])
 
         # Success message
-        title = ctk.CTkLabel(
+        title = create_label(
             center_frame,
             text=S.STEP2_TITLE,
-            font=FONTS['h1'],
-            text_color=COLORS_DARK['success']
+            style="title_success"
         )
         title.pack(pady=(SPACING['md'], SPACING['sm']))
+        self._add_problem_banner(center_frame, before=title)
 
-        desc = ctk.CTkLabel(
+        desc = create_label(
             center_frame,
             text=S.STEP2_DESCRIPTION,
-            text_color=COLORS_DARK['text_secondary'],
-            font=FONTS['body']
+            style="body"
         )
         desc.pack(pady=(0, SPACING['lg']))
 
@@ -344,10 +536,6 @@ class Application:
         self.stats_card = StatsCard(center_frame)
         self.stats_card.pack(padx=SPACING['xl'], pady=SPACING['md'], fill="x")
 
-        # Keep references for updating
-        self.buffer_count_label = self.stats_card.get_count_label()
-        self.buffer_caption_label = self.stats_card.get_caption_label()
-
         # Info callout box with lightbulb icon
         info_callout = InfoCallout(
             center_frame,
@@ -358,11 +546,10 @@ class Application:
         info_callout.pack(padx=SPACING['xl'], pady=SPACING['md'], fill="x")
 
         # Continue text
-        continue_info = ctk.CTkLabel(
+        continue_info = create_label(
             center_frame,
             text=S.STEP2_CONTINUE_INFO,
-            text_color=COLORS_DARK['text_tertiary'],
-            font=FONTS['caption'],
+            style="caption",
             justify="center"
         )
         continue_info.pack(pady=(SPACING['md'], SPACING['sm']))
@@ -375,32 +562,42 @@ class Application:
         )
         self.next_button.pack(pady=SPACING['sm'])
 
-        # Start updating buffer stats
-        self._update_buffer_stats()
-
-    def _build_step3_send_message(self):
-        """Build Step 4: Enter username to search"""
+    def _enter_step3_send_message(self):
+        """Show Step 4: Enter username to search (reset to an empty entry)"""
         self.step_label.configure(text=S.STEP3_LABEL)
+        self._show_page(STATE_STEP3_SEND_MESSAGE, self._create_step3_send_message)
+
+        self.username_entry.delete(0, "end")
+        self._last_username_text = ""
+        self.username_entry.focus()
+        self.buffer_var.set(S.STEP3_BUFFER_LOADING)
+        self.search_button.configure(state="disabled")
+        self._last_stats_key = None
+        self._active_stats_view = self._show_step3_stats
+
+        # Continue updating buffer stats
+        self._update_buffer_stats()
 
+    def _create_step3_send_message(self, parent):
+        """Create Step 4 (username entry) widgets"""
         # Center container
-        center_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        center_frame = ctk.CTkFrame(parent, fg_color="transparent")
         center_frame.pack(expand=True, fill="both", pady=SPACING['lg'])
 
         # Title
-        title = ctk.CTkLabel(
+        title = create_label(
             center_frame,
             text=S.STEP3_TITLE,
-            font=FONTS['h1'],
-            text_color=COLORS_DARK['text_primary']
+            style="title"
         )
         title.pack(pady=(SPACING['md'], SPACING['lg']))
+        self._add_problem_banner(center_frame, before=title)
 
         # Instructions
-        instruction = ctk.CTkLabel(
+        instruction = create_label(
             center_frame,
             text=S.STEP3_INSTRUCTION,
-            text_color=COLORS_DARK['text_secondary'],
-            font=FONTS['body'],
+            style="body",
             justify="center"
         )
         instruction.pack(pady=(0, SPACING['xl']))
@@ -419,34 +616,29 @@ class Application:
         username_frame.pack()
 
         # @ prefix label
-        at_label = ctk.CTkLabel(
+        at_label = create_label(
             username_frame,
             text="@",
-            font=FONTS['h2'],
-            text_color=COLORS_DARK['text_tertiary']
+            style="prefix"
         )
         at_label.pack(side="left", padx=(SPACING['sm'], 0))
 
-        self.username_entry = ctk.CTkEntry(
+        self.username_entry = create_entry(
             username_frame,
             font=FONTS['h2'],
             width=220,
-            height=DIMENSIONS['input_height'],
             fg_color="transparent",
             border_width=0,
-            text_color=COLORS_DARK['text_primary'],
             placeholder_text="username"
         )
         self.username_entry.pack(side="left", padx=(0, SPACING['sm']))
         self.username_entry.bind('<KeyRelease>', self._on_username_changed)
-        self.username_entry.focus()
 
         # Buffer still updating
-        self.buffer_label_step3 = ctk.CTkLabel(
+        self.buffer_label_step3 = create_label(
             center_frame,
-            text=S.STEP3_BUFFER_LOADING,
-            text_color=COLORS_DARK['text_tertiary'],
-            font=FONTS['caption']
+            textvariable=self.buffer_var,
+            style="caption"
         )
         self.buffer_label_step3.pack(pady=(SPACING['lg'], SPACING['sm']))
 
@@ -459,68 +651,237 @@ class Application:
         )
         self.search_button.pack(pady=SPACING['sm'])
 
-        # Continue updating buffer stats
-        self._update_buffer_stats()
-
-    def _build_step4_searching(self):
-        """Build searching screen (brief loading while searching)"""
+    def _enter_step4_searching(self):
+        """Show searching screen (brief loading while searching)"""
         self.step_label.configure(text="")
+        self._show_page(STATE_STEP4_SEARCHING, self._create_step4_searching)
+        self.looking_label.configure(text=S.STEP4_LOOKING_FOR.format(username=self.username))
 
+    def _create_step4_searching(self, parent):
+        """Create searching screen widgets"""
         # Center container
-        center_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        center_frame = ctk.CTkFrame(parent, fg_color="transparent")
         center_frame.pack(expand=True, fill="both")
 
         # 🔍 Search icon
-        icon = ctk.CTkLabel(
+        icon = create_label(
             center_frame,
             text="🔍",
-            font=FONTS['display_icon'],
-            text_color=COLORS_DARK['text_primary']
+            style="icon"
         )
         icon.pack(pady=(SPACING['2xl'], SPACING['sm']))
 
         # Title
-        title = ctk.CTkLabel(
+        title = create_label(
             center_frame,
             text="Searching Chat Buffer",
-            font=FONTS['h1'],
-            text_color=COLORS_DARK['text_primary']
+            style="title"
         )
         title.pack(pady=(0, SPACING['lg']))
 
-        # Looking for username
-        looking = ctk.CTkLabel(
+        # Looking for username (text set on each visit)
+        self.looking_label = create_label(
             center_frame,
-            text=S.STEP4_LOOKING_FOR.format(username=self.username),
-            text_color=COLORS_DARK['text_secondary'],
-            font=FONTS['body']
+            text="",
+            style="body"
         )
-        looking.pack(pady=SPACING['sm'])
+        self.looking_label.pack(pady=SPACING['sm'])
 
         # Status
-        self.search_status = ctk.CTkLabel(
+        self.search_status = create_label(
             center_frame,
             text=S.STEP4_STATUS,
-            text_color=COLORS_DARK['primary'],
-            font=FONTS['caption']
+            style="caption_primary"
         )
         self.search_status.pack(pady=SPACING['md'])
 
-    def _build_step5_results(self):
-        """Build Step 5: Results - will be populated by _display_results"""
+    def _enter_step5_results(self):
+        """Show Step 5: Results for the last search"""
         self.step_label.configure(text=S.RESULTS_LABEL)
-        # Results content will be added by _display_results method
+        self._show_page(STATE_STEP5_RESULTS, self._create_step5_results)
+        self._render_results(self.last_search_results, self.last_search_stats)
+
+    def _create_step5_results(self, parent):
+        """Create Step 5 widgets: a found and a not-found view, shown one at a time"""
+        self.result_count_var = ctk.StringVar(value="")
+        self.result_fail_details_var = ctk.StringVar(value="")
+
+        # SUCCESS - Messages found
+        self._results_found_frame = ctk.CTkFrame(parent, fg_color="transparent")
+
+        # ✅ Icon
+        icon = create_label(
+            self._results_found_frame,
+            text="✅",
+            style="icon"
+        )
+        icon.pack(pady=(SPACING['lg'], SPACING['sm']))
+
+        # Title
+        title = create_label(
+            self._results_found_frame,
+            text=S.RESULTS_SUCCESS_TITLE,
+            style="title_success"
+        )
+        title.pack(pady=(0, SPACING['xs']))
+
+        # Count (only packed when there are multiple messages)
+        self._result_count_label = create_label(
+            self._results_found_frame,
+            textvariable=self.result_count_var,
+            style="caption"
+        )
+
+        # Message card with green left border
+        self._result_msg_card = MessageCard(self._results_found_frame, border_scheme="success")
+        self._result_msg_card.pack(padx=SPACING['xl'], pady=SPACING['md'], fill="x")
+
+        # FAILURE - No messages found (INFORMATIONAL BLUE, not error red)
+        self._results_notfound_frame = ctk.CTkFrame(parent, fg_color="transparent")
+
+        # ℹ️ Icon (informational, not error)
+        icon = create_label(
+            self._results_notfound_frame,
+            text="ℹ️",
+            style="icon"
+        )
+        icon.pack(pady=(SPACING['lg'], SPACING['sm']))
+
+        # Title (informational blue, not error red)
+        title = create_label(
+            self._results_notfound_frame,
+            text=S.RESULTS_FAIL_TITLE,
+            style="title_primary"
+        )
+        title.pack(pady=(0, SPACING['md']))
+
+        # Informational card (blue tint)
+        info_card = ctk.CTkFrame(
+            self._results_notfound_frame,
+            fg_color=COLORS_DARK['bg_surface'],
+            corner_radius=DIMENSIONS['corner_radius'],
+            border_width=1,
+            border_color=COLORS_DARK['primary']
+        )
+        info_card.pack(padx=SPACING['xl'], pady=SPACING['md'], fill="x")
+
+        # Details text
+        details = create_label(
+            info_card,
+            textvariable=self.result_fail_details_var,
+            style="body",
+            justify="center"
+        )
+        details.pack(padx=SPACING['md'], pady=SPACING['md'])
+
+        # Possible reasons (bulleted list)
+        reasons = create_label(
+            info_card,
+            text=S.RESULTS_FAIL_REASONS,
+            style="caption",
+            justify="left"
+        )
+        reasons.pack(anchor="w", padx=SPACING['md'], pady=(0, SPACING['md']))
+
+        # Button frame (result views are packed above it)
+        self._results_button_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        self._results_button_frame.pack(pady=SPACING['md'])
+
+        # Search Again button (searches same buffer with new username)
+        search_again_btn = create_primary_button(
+            self._results_button_frame,
+            text=S.RESULTS_BUTTON_SEARCH_AGAIN,
+            command=self._on_search_again
+        )
+        search_again_btn.pack(side="left", padx=SPACING['xs'])
+
+        # Start new test button (secondary style)
+        new_test_btn = create_secondary_button(
+            self._results_button_frame,
+            text=S.RESULTS_BUTTON_NEW_TEST,
+            command=self._on_new_test
+        )
+        new_test_btn.pack(side="left", padx=SPACING['xs'])
+
+    def _render_results(self, matches, stats):
+        """
+        Fill in and show the results view for a search
+
+        Args:
+            matches: Messages found for the searched username
+            stats: Buffer statistics at search time
+        """
+        self._results_found_frame.pack_forget()
+        self._results_notfound_frame.pack_forget()
+
+        if matches:
+            match = matches[0]  # Show most recent message
+            timestamp_str = format_clock_time(match.timestamp)
+
+            # Show count if multiple messages
+            if len(matches) > 1:
+                self.result_count_var.set(
+                    S.RESULTS_SUCCESS_COUNT.format(count=len(matches), username=self.username)
+                )
+                self._result_count_label.pack(pady=SPACING['xs'], before=self._result_msg_card.frame)
+            else:
+                self._result_count_label.pack_forget()
+
+            self._result_msg_card.set_message(
+                text=match.message,
+                timestamp=timestamp_str,
+                header=S.RESULTS_LATEST_MESSAGE
+            )
+            shown = self._results_found_frame
+
+        else:
+            self.result_fail_details_var.set(S.RESULTS_FAIL_DETAILS.format(
+                username=self.username,
+                count=stats['message_count'],
+                seconds=int(stats['time_span_seconds'])
+            ))
+            shown = self._results_notfound_frame
+
+        shown.pack(expand=True, fill="both", pady=SPACING['lg'], before=self._results_button_frame)
 
     # Event Handlers
 
     def _on_url_changed(self, event=None):
         """Handle URL entry changes with debouncing"""
-        # Cancel previous validation if exists
-        if self.validation_after_id:
-            self.root.after_cancel(self.validation_after_id)
+        # Ignore keys that did not change the text (arrows, modifiers, ...)
+        url_text = self.url_entry.get()
+        if url_text == self._last_url_text:
+            return
+        self._last_url_text = url_text
+
+        # Invalidate any validation in flight and restart the quiet period
+        self._validation_seq += 1
+        self._last_url_edit = time.monotonic()
 
-        # Schedule validation after 500ms
-        self.validation_after_id = self.root.after(500, self._validate_url)
+        # One pending timer covers a whole burst of keystrokes
+        if self.validation_after_id is None:
+            self.validation_after_id = self.root.after(URL_DEBOUNCE_MS, self._poll_validate)
+
+    def _poll_validate(self):
+        """Validate once typing has paused for URL_DEBOUNCE_MS, else wait out the rest"""
+        wait_ms = URL_DEBOUNCE_MS - int((time.monotonic() - self._last_url_edit) * 1000)
+        if wait_ms > 0:
+            self.validation_after_id = self.root.after(wait_ms, self._poll_validate)
+        else:
+            self.validation_after_id = None
+            self._validate_url()
+
+    def _set_status(self, status, text):
+        """
+        Show a URL status message
+
+        Args:
+            status: One of the _STATUS_* (dot color, label color) pairs
+            text: Status text
+        """
+        dot_color, label_color = status
+        self.status_dot.configure(text_color=dot_color)
+        self.status_label.configure(text=text, text_color=label_color)
 
     def _validate_url(self):
         """Validate the entered URL"""
@@ -529,45 +890,55 @@ class Application:
         if not url:
             self.url_icon_label.configure(text="")
             self.start_button.configure(state="disabled")
-            self.status_dot.configure(text_color=COLORS_DARK['text_tertiary'])
-            self.status_label.configure(text=S.STEP1_HINT, text_color=COLORS_DARK['text_tertiary'])
+            self._set_status(_STATUS_IDLE, S.STEP1_HINT)
             return
 
-        # Parse URL
-        self.video_id = parse_youtube_url(url)
+        # Parse URL (edits that only add surrounding whitespace reuse the last parse)
+        if url != self._last_parsed[0]:
+            self._last_parsed = (url, parse_youtube_url(url))
+        self.video_id = self._last_parsed[1]
 
         if not self.video_id:
             self.url_icon_label.configure(text="⚠️")
             self.start_button.configure(state="disabled")
-            self.status_dot.configure(text_color=COLORS_DARK['error'])
-            self.status_label.configure(text=S.STEP1_INVALID_URL, text_color=COLORS_DARK['error'])
+            self._set_status(_STATUS_ERR, S.STEP1_INVALID_URL)
             return
 
         # Show validating
         self.url_icon_label.configure(text="⏳")
-        self.status_dot.configure(text_color=COLORS_DARK['warning'])
-        self.status_label.configure(text=S.STEP1_VALIDATING, text_color=COLORS_DARK['primary'])
+        self._set_status(_STATUS_WARN, S.STEP1_VALIDATING)
 
-        # Schedule validation to run after UI updates
-        self.root.after(50, self._do_validation, self.video_id)
+        # Check the stream off the UI thread; only the latest request counts
+        self._validation_seq += 1
+        on_done = partial(self._on_validation_done, self._validation_seq)
+        validate_livestream_async(self.video_id, on_done)
 
-    def _do_validation(self, video_id):
-        """Perform validation (runs after UI updates)"""
-        result = validate_livestream(video_id)
-        self._handle_validation_result(result)
+    def _on_validation_done(self, seq, result):
+        """Hand a validation result to the UI thread (may run on a background thread)"""
+        # Don't wake the UI for a result that is already stale (rechecked there)
+        if seq == self._validation_seq:
+            self.root.after(0, self._handle_validation_result, result, seq)
+
+    def _handle_validation_result(self, result, seq):
+        """
+        Handle validation result
+
+        Args:
+            result: Result mapping from validate_livestream
+            seq: Request number the result belongs to
+        """
+        if seq != self._validation_seq:
+            # URL changed (or step was left) since this request started
+            return
 
-    def _handle_validation_result(self, result):
-        """Handle validation result"""
         if result['valid'] and result['live']:
             self.url_icon_label.configure(text="✓")
             self.start_button.configure(state="normal")
-            self.status_dot.configure(text_color=COLORS_DARK['success'])
-            self.status_label.configure(text=S.STEP1_READY, text_color=COLORS_DARK['success'])
+            self._set_status(_STATUS_OK, S.STEP1_READY)
         else:
             self.url_icon_label.configure(text="⚠️")
             self.start_button.configure(state="disabled")
-            self.status_dot.configure(text_color=COLORS_DARK['error'])
-            self.status_label.configure(text=result['error'], text_color=COLORS_DARK['error'])
+            self._set_status(_STATUS_ERR, result['error'])
 
     def _on_start_clicked(self):
         """Start monitoring - transition to connecting state"""
@@ -575,94 +946,206 @@ class Application:
             messagebox.showerror(S.MSGBOX_ERROR, S.MSGBOX_ERROR_INVALID_URL)
             return
 
+        # Only one connection attempt per click (step 1 re-disables it on return)
+        self.start_button.configure(state="disabled")
+
         # Go to connecting screen
         self._set_state(STATE_CONNECTING)
 
-        # Schedule connection
-        self.root.after(100, self._do_connection, self.video_id)
+        # Connect in the background so the connecting screen stays responsive
+        Thread(target=self._connect_worker, args=(self.video_id,), daemon=True).start()
 
-    def _do_connection(self, video_id):
-        """Perform the actual connection"""
+    def _connect_worker(self, video_id):
+        """Perform the actual connection (runs in background thread)"""
+        chat_buffer = None
         try:
-            import pytchat
-            chat = pytchat.create(video_id=video_id)
+            # Normally already loaded by the startup prefetch
+            if YouTubeChatBuffer is None:
+                _load_chat_modules()
+
+            # Not interruptable: pytchat's SIGINT handler can only be
+            # installed from the main thread
+            chat = pytchat.create(video_id=video_id, interruptable=False)
 
             # Start buffering
-            self.chat_buffer = YouTubeChatBuffer(video_id)
-            success = self.chat_buffer.start_buffering(chat_object=chat)
-
-            if success:
-                # Show waiting screen with countdown
-                self._show_buffer_delay_screen()
-                # Wait before showing monitoring screen
-                self._start_countdown(self.buffer_delay, self._on_buffer_delay_complete)
+            chat_buffer = YouTubeChatBuffer(video_id)
+            chat_buffer.on_stats_change(self._on_buffer_stats_pushed)
+            if chat_buffer.start_buffering(chat_object=chat):
+                error_msg = None
             else:
-                error_msg = self.chat_buffer.get_error_message() if self.chat_buffer else "Unknown error"
-                messagebox.showerror(S.MSGBOX_CONNECTION_FAILED, error_msg)
-                self._set_state(STATE_STEP1_URL)
+                error_msg = chat_buffer.get_error_message() or "Unknown error"
+                chat_buffer = None
 
         except Exception as e:
-            messagebox.showerror(S.MSGBOX_CONNECTION_FAILED, S.MSGBOX_CONNECTION_FAILED_MSG.format(error=str(e)))
+            chat_buffer = None
+            error_msg = S.MSGBOX_CONNECTION_FAILED_MSG.format(error=str(e))
+
+        self.root.after(0, self._on_connect_done, chat_buffer, error_msg)
+
+    def _on_connect_done(self, chat_buffer, error_msg):
+        """
+        Handle the connection result on the UI thread
+
+        Args:
+            chat_buffer: Buffering YouTubeChatBuffer, or None on failure
+            error_msg: Message to show when the connection failed
+        """
+        if chat_buffer is not None:
+            self.chat_buffer = chat_buffer
+            self._reported_problem = None
+            self._hide_problem_banners()
+            # Show waiting screen, then the monitoring screen after the countdown
+            self._show_delay_screen(PAGE_BUFFER_DELAY, self.buffer_delay, self._on_buffer_delay_complete)
+        else:
+            messagebox.showerror(S.MSGBOX_CONNECTION_FAILED, error_msg)
             self._set_state(STATE_STEP1_URL)
 
-    def _update_buffer_stats(self):
-        """Update buffer statistics display"""
-        # Only update if in monitoring or send message states
-        if self.current_state not in [STATE_STEP2_MONITORING, STATE_STEP3_SEND_MESSAGE]:
+    def _on_buffer_stats_pushed(self, stats):
+        """Receive stats from the buffering thread and hand them to the UI thread"""
+        self._stats_events.put(stats)
+        # One drain per burst: later pushes ride along with the pending one
+        if not self._stats_drain_pending:
+            self._stats_drain_pending = True
+            self.root.after_idle(self._drain_stats_events)
+
+    def _drain_stats_events(self):
+        """Render only the newest queued stats (UI thread)"""
+        # Cleared before draining so a push racing with us schedules a new drain
+        self._stats_drain_pending = False
+        latest = None
+        while True:
+            try:
+                latest = self._stats_events.get_nowait()
+            except Empty:
+                break
+
+        if latest is not None:
+            self._apply_stats(latest)
+            self._report_stream_problem()
+
+    def _report_stream_problem(self):
+        """Show the stream-ended or error message once per new problem"""
+        # Only the monitoring and send message steps report problems
+        if self._active_stats_view is None or not self.chat_buffer:
             return
 
-        if self.chat_buffer:
-            stats = self.chat_buffer.get_buffer_stats()
-            msg_count = stats['message_count']
-            time_span = int(stats['time_span_seconds'])
+        stream_ended = self.chat_buffer.is_stream_ended()
+        problem = S.MSGBOX_STREAM_ENDED_MSG if stream_ended else self.chat_buffer.get_error_message()
+        if not problem or problem == self._reported_problem:
+            return
+        self._reported_problem = problem
 
-            stats_text = S.STEP2_BUFFER_STATS.format(count=msg_count, seconds=time_span)
+        # Inline rather than a modal dialog, which would stall the event loop
+        color = COLORS_DARK['warning'] if stream_ended else COLORS_DARK['error']
+        self.stream_problem_var.set(problem)
+        for banner, before in self._problem_banners:
+            banner.configure(text_color=color)
+            banner.pack(before=before, padx=SPACING['xl'], pady=(0, SPACING['sm']))
 
-            # Update appropriate label based on current state
-            try:
-                if self.current_state == STATE_STEP2_MONITORING:
-                    # Update stats card with separate count and caption
-                    if hasattr(self, 'buffer_count_label') and self.buffer_count_label.winfo_exists():
-                        self.buffer_count_label.configure(text=str(msg_count))
-                    if hasattr(self, 'buffer_caption_label') and self.buffer_caption_label.winfo_exists():
-                        self.buffer_caption_label.configure(
-                            text=f"messages buffered ({time_span} seconds)"
-                        )
-                elif self.current_state == STATE_STEP3_SEND_MESSAGE:
-                    if hasattr(self, 'buffer_label_step3') and self.buffer_label_step3.winfo_exists():
-                        self.buffer_label_step3.configure(text=stats_text)
-            except Exception:
-                # Widget was destroyed, stop updating
-                return
+    def _add_problem_banner(self, parent, before):
+        """
+        Create the hidden stream problem banner for a page that shows stats
+
+        Args:
+            parent: Container the banner is packed into
+            before: Widget the banner is packed above once shown
+        """
+        banner = ctk.CTkLabel(
+            parent,
+            textvariable=self.stream_problem_var,
+            font=FONTS['body_sm'],
+            wraplength=420
+        )
+        self._problem_banners.append((banner, before))
+
+    def _hide_problem_banners(self):
+        """Hide the stream problem banners (for a new connection)"""
+        self.stream_problem_var.set("")
+        for banner, _ in self._problem_banners:
+            banner.pack_forget()
+
+    def _apply_stats(self, stats):
+        """
+        Render buffer statistics on the current step (UI thread only)
+
+        Args:
+            stats: Dict from YouTubeChatBuffer.get_buffer_stats()
+        """
+        # Only the monitoring and send message steps show stats
+        view = self._active_stats_view
+        if view is None:
+            return
+
+        msg_count = stats['message_count']
+        time_span = int(stats['time_span_seconds'])
+
+        # Skip label writes when nothing visible changed
+        rendered = (msg_count, time_span)
+        if rendered == self._last_stats_key:
+            return
+        self._last_stats_key = rendered
+
+        view(msg_count, time_span)
+
+    def _show_step3_stats(self, count, seconds):
+        """Show buffer statistics on the username entry step"""
+        self.buffer_var.set(S.STEP2_BUFFER_STATS.format(count=count, seconds=seconds))
+
+    def _update_buffer_stats(self):
+        """
+        Watchdog for the buffer: refresh the elapsed time and report stream errors
+
+        Message counts are pushed by the buffer as they arrive (see
+        _on_buffer_stats_pushed), so this only needs to run every few seconds.
+        """
+        # Never run two watchdog chains (e.g. when a step is re-entered quickly)
+        if self.stats_after_id:
+            self.root.after_cancel(self.stats_after_id)
+            self.stats_after_id = None
 
-            # Check for errors
-            if self.chat_buffer.is_stream_ended():
-                messagebox.showwarning(S.MSGBOX_STREAM_ENDED, S.MSGBOX_STREAM_ENDED_MSG)
-            elif self.chat_buffer.get_error_message():
-                error = self.chat_buffer.get_error_message()
-                messagebox.showerror(S.MSGBOX_ERROR, error)
+        # Only the monitoring and send message steps show stats
+        if self._active_stats_view is None:
+            return
 
-        # Schedule next update in 2 seconds
-        self.stats_after_id = self.root.after(2000, self._update_buffer_stats)
+        if self.chat_buffer:
+            self._apply_stats(self.chat_buffer.get_buffer_stats())
+
+            # Catch problems that arrived while no step was showing stats
+            self._report_stream_problem()
+
+        # Schedule next check in 5 seconds
+        self.stats_after_id = self.root.after(5000, self._update_buffer_stats)
 
     def _start_countdown(self, seconds, callback):
         """Start a countdown timer"""
-        self.countdown_seconds = seconds
+        self._countdown_deadline = time.monotonic() + seconds
+        self._last_countdown_text = None
         self.countdown_callback = callback
         self._update_countdown()
 
+    def _queue_countdown_update(self):
+        """Run the next countdown update once pending events have been handled"""
+        self.delay_timer_id = self.root.after_idle(self._update_countdown)
+
     def _update_countdown(self):
         """Update countdown display"""
-        if hasattr(self, 'countdown_label') and self.countdown_label.winfo_exists():
-            self.countdown_label.configure(text=str(self.countdown_seconds))
-
-            if self.countdown_seconds > 0:
-                self.countdown_seconds -= 1
-                self.delay_timer_id = self.root.after(1000, self._update_countdown)
-            else:
-                # Countdown finished, execute callback
-                if self.countdown_callback:
-                    self.countdown_callback()
+        # Derived from the deadline each tick, so late ticks never add drift
+        left = self._countdown_deadline - time.monotonic()
+        remaining = max(0, ceil(left))
+
+        text = str(remaining)
+        if text != self._last_countdown_text:
+            self.countdown_var.set(text)
+            self._last_countdown_text = text
+
+        if remaining > 0:
+            # Wake up right when the displayed number next changes
+            delay_ms = int((left - (remaining - 1)) * 1000) + 1
+            self.delay_timer_id = self.root.after(delay_ms, self._queue_countdown_update)
+        else:
+            # Countdown finished, execute callback
+            if self.countdown_callback:
+                self.countdown_callback()
 
     def _on_buffer_delay_complete(self):
         """Called after buffer delay completes"""
@@ -670,14 +1153,14 @@ class Application:
 
     def _on_next_from_monitoring(self):
         """User clicked Next Step from monitoring screen"""
-        # Cancel stats timer before changing screens
+        # Stop stats updates before changing screens
+        self._active_stats_view = None
         if self.stats_after_id:
             self.root.after_cancel(self.stats_after_id)
             self.stats_after_id = None
 
         # Show search delay screen first, then go to username entry
-        self._show_search_delay_screen()
-        self._start_countdown(self.search_delay, self._on_search_delay_complete)
+        self._show_delay_screen(PAGE_SEARCH_DELAY, self.search_delay, self._on_search_delay_complete)
 
     def _on_search_delay_complete(self):
         """Called after search delay completes - show username entry"""
@@ -686,6 +1169,11 @@ class Application:
     def _on_username_changed(self, event=None):
         """Handle username entry changes"""
         username = self.username_entry.get().strip()
+        # Ignore keys that did not change the text (arrows, modifiers, ...)
+        if username == self._last_username_text:
+            return
+        self._last_username_text = username
+
         if username:
             self.search_button.configure(state="normal")
         else:
@@ -707,172 +1195,74 @@ class Application:
         # Go to searching state
         self._set_state(STATE_STEP4_SEARCHING)
 
-        # Search in background thread
-        def search_worker():
-            matches = self.chat_buffer.search_by_username(self.username)
-            stats = self.chat_buffer.get_buffer_stats()
-            self.root.after(0, self._display_results, matches, stats)
-
-        Thread(target=search_worker, daemon=True).start()
-
-    def _display_results(self, matches, stats):
-        """Display search results"""
-        # Store results for potential re-search
-        self.last_search_results = matches
-        self.last_search_stats = stats
-
-        self._set_state(STATE_STEP5_RESULTS)
-
-        # Center container
-        result_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        result_frame.pack(expand=True, fill="both", pady=SPACING['lg'])
+        # Search on the background worker
+        self._search_seq += 1
+        future = self._worker.submit(self._search_sync, self.chat_buffer, self.username)
+        future.add_done_callback(partial(self._on_search_done, self._search_seq))
 
-        if matches:
-            # SUCCESS - Messages found
-            match = matches[0]  # Show most recent message
-            timestamp_str = match['timestamp'].strftime("%H:%M:%S")
-
-            # ✅ Icon
-            icon = ctk.CTkLabel(
-                result_frame,
-                text="✅",
-                font=FONTS['display_icon'],
-                text_color=COLORS_DARK['text_primary']
-            )
-            icon.pack(pady=(SPACING['lg'], SPACING['sm']))
-
-            # Title
-            title = ctk.CTkLabel(
-                result_frame,
-                text=S.RESULTS_SUCCESS_TITLE,
-                font=FONTS['h1'],
-                text_color=COLORS_DARK['success']
-            )
-            title.pack(pady=(0, SPACING['xs']))
+    @staticmethod
+    def _search_sync(chat_buffer, username):
+        """
+        Search the buffer for a username (runs on the background worker)
 
-            # Show count if multiple messages
-            if len(matches) > 1:
-                count_label = ctk.CTkLabel(
-                    result_frame,
-                    text=S.RESULTS_SUCCESS_COUNT.format(count=len(matches), username=self.username),
-                    text_color=COLORS_DARK['text_tertiary'],
-                    font=FONTS['caption']
-                )
-                count_label.pack(pady=SPACING['xs'])
+        Returns:
+            Tuple of (matches, stats)
+        """
+        matches = chat_buffer.search_by_username(username)
+        stats = chat_buffer.get_buffer_stats()
+        return matches, stats
 
-            # Message card with green left border
-            msg_card = MessageCard(result_frame, border_scheme="success")
-            msg_card.pack(padx=SPACING['xl'], pady=SPACING['md'], fill="x")
-            msg_card.set_message(
-                text=match['message'],
-                timestamp=timestamp_str,
-                header=S.RESULTS_LATEST_MESSAGE
-            )
+    def _on_search_done(self, seq, future):
+        """Hand finished search results to the UI thread"""
+        if seq == self._search_seq:
+            self.root.after(0, self._display_results, *future.result(), seq)
 
-        else:
-            # FAILURE - No messages found (INFORMATIONAL BLUE, not error red)
-            msg_count = stats['message_count']
-            time_span = int(stats['time_span_seconds'])
-
-            # ℹ️ Icon (informational, not error)
-            icon = ctk.CTkLabel(
-                result_frame,
-                text="ℹ️",
-                font=FONTS['display_icon'],
-                text_color=COLORS_DARK['text_primary']
-            )
-            icon.pack(pady=(SPACING['lg'], SPACING['sm']))
-
-            # Title (informational blue, not error red)
-            title = ctk.CTkLabel(
-                result_frame,
-                text=S.RESULTS_FAIL_TITLE,
-                font=FONTS['h1'],
-                text_color=COLORS_DARK['primary']
-            )
-            title.pack(pady=(0, SPACING['md']))
-
-            # Informational card (blue tint)
-            info_card = ctk.CTkFrame(
-                result_frame,
-                fg_color=COLORS_DARK['bg_surface'],
-                corner_radius=DIMENSIONS['corner_radius'],
-                border_width=1,
-                border_color=COLORS_DARK['primary']
-            )
-            info_card.pack(padx=SPACING['xl'], pady=SPACING['md'], fill="x")
-
-            # Details text
-            details = ctk.CTkLabel(
-                info_card,
-                text=f"No messages from @{self.username}\n\nChecked {msg_count} messages over {time_span} seconds",
-                justify="center",
-                text_color=COLORS_DARK['text_secondary'],
-                font=FONTS['body']
-            )
-            details.pack(padx=SPACING['md'], pady=SPACING['md'])
-
-            # Possible reasons (bulleted list)
-            reasons_text = (
-                "Possible reasons:\n"
-                "• Messages may be shadowbanned\n"
-                "• Username might be misspelled\n"
-                "• User hasn't sent messages during buffer period\n"
-                "• Messages were deleted by moderators"
-            )
-            reasons = ctk.CTkLabel(
-                info_card,
-                text=reasons_text,
-                justify="left",
-                text_color=COLORS_DARK['text_tertiary'],
-                font=FONTS['caption']
-            )
-            reasons.pack(anchor="w", padx=SPACING['md'], pady=(0, SPACING['md']))
+    def _display_results(self, matches, stats, seq):
+        """
+        Display search results
 
-        # Button frame
-        button_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        button_frame.pack(pady=SPACING['md'])
+        Args:
+            matches: Messages found for the username
+            stats: Buffer stats at the time of the search
+            seq: Search sequence number; results of superseded searches are dropped
+        """
+        if seq != self._search_seq:
+            return
 
-        # Search Again button (searches same buffer with new username)
-        search_again_btn = create_primary_button(
-            button_frame,
-            text=S.RESULTS_BUTTON_SEARCH_AGAIN,
-            command=self._on_search_again
-        )
-        search_again_btn.pack(side="left", padx=SPACING['xs'])
+        # Store results for potential re-search (and for the results page)
+        self.last_search_results = matches
+        self.last_search_stats = stats
 
-        # Start new test button (secondary style)
-        new_test_btn = create_secondary_button(
-            button_frame,
-            text=S.RESULTS_BUTTON_NEW_TEST,
-            command=self._on_new_test
-        )
-        new_test_btn.pack(side="left", padx=SPACING['xs'])
+        self._set_state(STATE_STEP5_RESULTS)
 
     def _on_search_again(self):
         """Search again with a different username (keeps buffer)"""
         # Go directly to username entry (skip delay since buffer is already collected)
         self._set_state(STATE_STEP3_SEND_MESSAGE)
 
+    def _cancel_timers(self):
+        """
+        Cancel the validation, stats and countdown timers
+
+        Each screen starts the timers it needs when entered, so any still
+        pending belong to the screen being left.
+        """
+        for after_id in (self.validation_after_id, self.stats_after_id, self.delay_timer_id):
+            if after_id:
+                self.root.after_cancel(after_id)
+        self.validation_after_id = self.stats_after_id = self.delay_timer_id = None
+
     def _on_new_test(self):
         """Reset and start a new test"""
-        # Cancel any pending callbacks
-        if self.validation_after_id:
-            self.root.after_cancel(self.validation_after_id)
-        if self.stats_after_id:
-            self.root.after_cancel(self.stats_after_id)
-        if self.delay_timer_id:
-            self.root.after_cancel(self.delay_timer_id)
+        self._cancel_timers()
+        self._search_seq += 1  # Drop any search still in flight
 
         # Stop buffering in background
         if self.chat_buffer:
             buffer_to_stop = self.chat_buffer
+            buffer_to_stop.on_stats_change(None)
             self.chat_buffer = None
-
-            def stop_worker():
-                buffer_to_stop.stop_buffering()
-
-            Thread(target=stop_worker, daemon=True).start()
+            self._worker.submit(buffer_to_stop.stop_buffering)
 
         # Reset state
         self.username = None
@@ -885,5 +1275,14 @@ class Application:
 
     def cleanup(self):
         """Cleanup resources before closing"""
+        # Cancel pending callbacks so none fire on a closing window
+        self._cancel_timers()
+        self._validation_seq += 1  # Drop any validation still in flight
+        self._search_seq += 1
+        self._active_stats_view = None
+
         if self.chat_buffer:
+            self.chat_buffer.on_stats_change(None)
             self.chat_buffer.stop_buffering()
+            self.chat_buffer = None
+        self._worker.shutdown(wait=False)
@@ -4,13 +4,49 @@ Handles URL parsing and livestream validation with caching
 """
 
 import re
-import pytchat
-from datetime import datetime, timedelta
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Mapping
+from urllib.parse import urlsplit, parse_qs
 
 
-# Cache for validation results
-_validation_cache = {}
-_cache_timeout = 60  # seconds
+# Video ID pattern, compiled once at import
+_ID_RE = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+# Longer input is rejected before parsing (practical URL length limit)
+MAX_URL_LENGTH = 2048
+
+# Shortest URL form, "youtu.be/" + ID; anything shorter is a partial URL
+_MIN_URL_LENGTH = len('youtu.be/') + 11
+
+# Cache for validation results: video_id -> (result, time.monotonic() expiry),
+# least recently used first. Checks run on several threads, so every access
+# holds _cache_lock.
+_validation_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_timeout = 15  # seconds; a stream can go live or end at any time
+_invalid_cache_timeout = 600  # seconds; an invalid video ID stays invalid
+_cache_max_entries = 256
+
+# Fixed validation outcomes, shared (read-only) instead of rebuilt per call
+_RESULT_NO_ID = MappingProxyType({'valid': False, 'live': False, 'error': 'No video ID provided'})
+_RESULT_INVALID_ID = MappingProxyType({'valid': False, 'live': False, 'error': 'Invalid video ID'})
+_RESULT_LIVE = MappingProxyType({'valid': True, 'live': True, 'error': None})
+
+# Checks in progress: video_id -> Future shared by concurrent callers
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# HTTP client for stream checks, created on first use (see _get_http_client)
+_http_client = None
+_http_client_lock = threading.Lock()
+_PROBE_TIMEOUT = 5.0  # seconds
+
+# Runs stream checks for validate_livestream_async (threads start on first use)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="validate")
 
 
 def parse_youtube_url(url: str) -> str:
@@ -23,6 +59,11 @@ def parse_youtube_url(url: str) -> str:
       - https://youtu.be/VIDEO_ID
       - VIDEO_ID (11 characters, alphanumeric)
 
+    A URL inside surrounding text ("watch this https://youtu.be/ID") is
+    found as well. Input longer than MAX_URL_LENGTH (after stripping) is
+    rejected without being parsed, so pasting a huge block of text stays
+    cheap.
+
     Args:
         url: YouTube URL or video ID
 
@@ -33,34 +74,73 @@ def parse_youtube_url(url: str) -> str:
         return None
 
     url = url.strip()
+    if len(url) > MAX_URL_LENGTH:
+        return None
 
-    # Pattern 1: Direct video ID (11 alphanumeric characters)
-    if re.match(r'^[A-Za-z0-9_-]{11}$', url):
-        return url
+    # Direct video ID (11 alphanumeric characters)
+    if len(url) == 11:
+        return url if _ID_RE.match(url) else None
 
-    # Pattern 2: youtube.com/watch?v=VIDEO_ID
-    match = re.search(r'youtube\.com/watch\?v=([A-Za-z0-9_-]{11})', url)
-    if match:
-        return match.group(1)
+    # Cheap rejection of partial input (typed one keystroke at a time) and
+    # of text that can't name a YouTube host
+    if len(url) < _MIN_URL_LENGTH or 'youtu' not in url.lower():
+        return None
 
-    # Pattern 3: youtu.be/VIDEO_ID
-    match = re.search(r'youtu\.be/([A-Za-z0-9_-]{11})', url)
-    if match:
-        return match.group(1)
+    # Text around the URL ("my youtube link: youtu.be/ID"): try each token
+    # that could name a YouTube host
+    for token in url.split():
+        if 'youtu' in token.lower():
+            video_id = _parse_url_token(token)
+            if video_id is not None:
+                return video_id
 
     return None
 
 
-def validate_livestream(video_id: str) -> dict:
+def _parse_url_token(url: str) -> str:
+    """
+    Extract the video ID from a single whitespace-free URL
+
+    Args:
+        url: URL with or without scheme
+
+    Returns:
+        video_id if valid, None if invalid
+    """
+    # Split into host/path/query instead of scanning the whole string;
+    # scheme-less input like "youtu.be/ID" still needs a host
+    try:
+        parts = urlsplit(url if '://' in url else '//' + url)
+    except ValueError:
+        return None
+    host = parts.hostname or ''
+    if host.endswith('.youtube.com'):
+        host = 'youtube.com'  # www., m., ...
+
+    if host == 'youtu.be':
+        # youtu.be/VIDEO_ID
+        candidate = parts.path[1:12]
+    elif host == 'youtube.com' and parts.path == '/watch':
+        # youtube.com/watch?v=VIDEO_ID
+        candidate = parse_qs(parts.query).get('v', [''])[0][:11]
+    else:
+        return None
+
+    return candidate if _ID_RE.match(candidate) else None
+
+
+def validate_livestream(video_id: str) -> Mapping:
     """
     Check if video_id is a live stream
 
-    Uses caching to avoid API spam (60 second cache)
+    Uses caching to avoid API spam: invalid video IDs are remembered for
+    10 minutes, everything else for 15 seconds
 
     Args:
         video_id: YouTube video ID
 
     Returns:
+        Read-only mapping (shared between calls, do not modify):
         {
             'valid': bool,
             'live': bool,
@@ -68,78 +148,173 @@ def validate_livestream(video_id: str) -> dict:
         }
     """
     if not video_id:
-        return {
-            'valid': False,
-            'live': False,
-            'error': 'No video ID provided'
-        }
+        return _RESULT_NO_ID
 
     # Check cache
-    now = datetime.now()
-    if video_id in _validation_cache:
-        cached_result, cached_time = _validation_cache[video_id]
-        if (now - cached_time).total_seconds() < _cache_timeout:
-            return cached_result
-
-    # Validate with pytchat
-    chat = None
+    cached_result = _cache_get(video_id)
+    if cached_result is not None:
+        return cached_result
+
+    # Concurrent callers for the same video share one check
+    with _inflight_lock:
+        pending = _inflight.get(video_id)
+        if pending is None:
+            _inflight[video_id] = future = Future()
+    if pending is not None:
+        return pending.result()
+
     try:
-        chat = pytchat.create(video_id=video_id)
-
-        if chat.is_alive():
-            result = {
-                'valid': True,
-                'live': True,
-                'error': None
-            }
-        else:
-            result = {
-                'valid': True,
-                'live': False,
-                'error': 'Stream is not currently live'
-            }
+        result, ttl = _probe_livestream(video_id)
+        _cache_put(video_id, result, ttl)
+        future.set_result(result)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[video_id]
+
+    return result
+
+
+def _probe_livestream(video_id: str):
+    """
+    Ask YouTube about video_id (network request, not cached)
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Tuple of (result mapping, seconds to cache it)
+    """
+    # Validate with pytchat (imported here: it is slow to load and only
+    # needed once a URL has been entered)
+    from pytchat import exceptions, util
 
-    except pytchat.exceptions.InvalidVideoIdException:
-        result = {
+    ttl = _cache_timeout
+    try:
+        # The lookup pytchat.create() makes before it can fetch chat, without
+        # building a chat object (or sleeping, or installing a signal handler)
+        util.get_channelid(_get_http_client(), video_id)
+        result = _RESULT_LIVE
+
+    except exceptions.InvalidVideoIdException:
+        result = _RESULT_INVALID_ID
+        ttl = _invalid_cache_timeout
+
+    except Exception as e:
+        result = MappingProxyType({
             'valid': False,
             'live': False,
-            'error': 'Invalid video ID'
-        }
+            'error': f'Validation error: {str(e)}'
+        })
 
-    except Exception as e:
-        # Ignore signal errors from threading
-        error_str = str(e)
-        if 'signal' in error_str.lower() and 'main thread' in error_str.lower():
-            # Assume valid for now, will be properly validated when starting monitoring
-            result = {
-                'valid': True,
-                'live': True,
-                'error': None
-            }
+    return result, ttl
+
+
+def _get_http_client():
+    """
+    Get the shared HTTP client for stream checks, creating it on first use
+
+    Returns:
+        httpx.Client (httpx is installed with pytchat)
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            import httpx
+            _http_client = httpx.Client(timeout=_PROBE_TIMEOUT)
+        return _http_client
+
+
+def validate_livestream_async(video_id: str, callback) -> Future:
+    """
+    Check if video_id is a live stream without blocking the caller
+
+    A cached result is passed to callback immediately, on the calling
+    thread. Otherwise the check runs on a background thread and callback
+    is called there; UI callers must hand the result to their own thread.
+
+    Args:
+        video_id: YouTube video ID
+        callback: Called with the result mapping of validate_livestream
+
+    Returns:
+        Future resolving to the result mapping
+    """
+    cached_result = _cache_get(video_id) if video_id else None
+    if cached_result is not None:
+        future = Future()
+        future.set_result(cached_result)
+        callback(cached_result)
+        return future
+
+    def deliver(done):
+        error = done.exception()
+        if error is None:
+            callback(done.result())
         else:
-            result = {
+            # An unexpected failure must still reach the caller, or it would
+            # wait on the check forever
+            callback(MappingProxyType({
                 'valid': False,
                 'live': False,
-                'error': f'Validation error: {str(e)}'
-            }
+                'error': f'Validation error: {str(error)}'
+            }))
 
-    finally:
-        # Clean up
-        if chat:
-            try:
-                chat.terminate()
-            except:
-                pass
+    future = _executor.submit(validate_livestream, video_id)
+    future.add_done_callback(deliver)
+    return future
 
-    # Cache result
-    _validation_cache[video_id] = (result, now)
 
-    return result
+def _cache_get(video_id: str):
+    """
+    Look up a cached validation result
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        The cached result mapping, or None if missing or expired
+    """
+    with _cache_lock:
+        entry = _validation_cache.get(video_id)
+        if entry is None:
+            return None
+
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del _validation_cache[video_id]
+            return None
+
+        _validation_cache.move_to_end(video_id)
+        return result
+
+
+def _cache_put(video_id: str, result: Mapping, ttl: float = None):
+    """
+    Cache a validation result, evicting the least recently used entry when full
+
+    Args:
+        video_id: YouTube video ID
+        result: Result mapping from validate_livestream
+        ttl: Seconds to keep the result (default: _cache_timeout)
+    """
+    if ttl is None:
+        ttl = _cache_timeout
+    with _cache_lock:
+        _validation_cache[video_id] = (result, time.monotonic() + ttl)
+        _validation_cache.move_to_end(video_id)
+        if len(_validation_cache) > _cache_max_entries:
+            _validation_cache.popitem(last=False)
 
 
 def clear_cache():
     """
     Clear the validation cache
+
+    Checks still in progress are left alone; their results are cached
+    when they finish.
     """
-    global _validation_cache
-    _validation_cache = {}
+    with _cache_lock:
+        _validation_cache.clear()
@@ -3,16 +3,11 @@ Test chat engine functionality
 """
 
 import pytest
-import sys
-from pathlib import Path
-from datetime import datetime
+import threading
+import time
 from collections import deque
 
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
-from chat_engine import YouTubeChatBuffer
+from chat_engine import YouTubeChatBuffer, _next_poll_interval, MAX_POLL_INTERVAL
 
 
 class TestYouTubeChatBufferInit:
@@ -66,6 +61,35 @@ class TestBufferStats:
         assert 'message_count' in stats
         assert 'time_span_seconds' in stats
 
+    def test_get_buffer_stats_after_message(self):
+        """Test stats count messages and measure span from first message"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('user1', 'Hello')
+        stats = buffer.get_buffer_stats()
+        assert stats['message_count'] == 1
+        assert stats['time_span_seconds'] >= 0.0
+        assert isinstance(buffer.buffer[0].timestamp, float)
+
+    def test_stats_callback_on_new_messages(self):
+        """Test registered stats callback receives stats when messages arrive"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        received = []
+        buffer.on_stats_change(received.append)
+        buffer.add_message('user1', 'Hello')
+        buffer.add_message('user2', 'Hi')
+        assert [s['message_count'] for s in received] == [1, 2]
+
+    def test_stats_callback_errors_are_contained(self):
+        """Test a failing stats callback does not break message storage"""
+        buffer = YouTubeChatBuffer("test_video_id")
+
+        def failing(stats):
+            raise RuntimeError("window closed")
+
+        buffer.on_stats_change(failing)
+        buffer.add_message('user1', 'Hello')
+        assert buffer.get_buffer_stats()['message_count'] == 1
+
 
 class TestSearchBuffer:
     """Test buffer search functionality"""
@@ -80,31 +104,19 @@ class TestSearchBuffer:
         """Test searching buffer with manually added messages"""
         buffer = YouTubeChatBuffer("test_video_id")
 
-        # Manually add messages to buffer
-        buffer.buffer.append({
-            'author': 'user1',
-            'message': 'Hello world',
-            'timestamp': datetime.now()
-        })
-        buffer.buffer.append({
-            'author': 'user2',
-            'message': 'Test message',
-            'timestamp': datetime.now()
-        })
+        # Add messages through the ingestion path
+        buffer.add_message('user1', 'Hello world')
+        buffer.add_message('user2', 'Test message')
 
         results = buffer.search_buffer("Test")
         assert len(results) == 1
-        assert results[0]['message'] == 'Test message'
+        assert results[0].message == 'Test message'
 
     def test_search_buffer_case_sensitive(self):
         """Test search is case-sensitive"""
         buffer = YouTubeChatBuffer("test_video_id")
 
-        buffer.buffer.append({
-            'author': 'user1',
-            'message': 'Hello World',
-            'timestamp': datetime.now()
-        })
+        buffer.add_message('user1', 'Hello World')
 
         # Should not find lowercase 'world'
         results = buffer.search_buffer("world")
@@ -114,6 +126,64 @@ class TestSearchBuffer:
         results = buffer.search_buffer("World")
         assert len(results) == 1
 
+    def test_contains_identifier(self):
+        """Test existence check finds identifiers case-sensitively"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        assert buffer.contains_identifier("ABC") is False
+
+        buffer.add_message('user1', 'code ABC')
+        assert buffer.contains_identifier("ABC") is True
+        assert buffer.contains_identifier("abc") is False
+
+    def test_search_buffer_bulk_matches_search_buffer(self):
+        """Test bulk search returns the same messages as search_buffer"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('user1', 'tag ABC at the end ABC')
+        buffer.add_message('user2', 'no tag')
+        buffer.add_message('user3', 'ABC')
+        buffer.add_message('user4', 'AB')
+        buffer.add_message('user5', 'C split across messages')
+
+        assert buffer.search_buffer_bulk("ABC") == buffer.search_buffer("ABC")
+        assert [r.author for r in buffer.search_buffer_bulk("ABC")] == ['user1', 'user3']
+        assert buffer.search_buffer_bulk("missing") == []
+
+        # Messages added after a search are picked up by the next one
+        buffer.add_message('user6', 'late ABC')
+        assert [r.author for r in buffer.search_buffer_bulk("ABC")] == ['user1', 'user3', 'user6']
+
+    def test_search_buffer_ci(self):
+        """Test case-insensitive search, including case folding"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('user1', 'Hello World')
+        buffer.add_message('user2', 'STRASSE')
+        buffer.add_message('user3', 'nothing')
+
+        assert [r.author for r in buffer.search_buffer_ci("world")] == ['user1']
+        assert [r.author for r in buffer.search_buffer_ci("straße")] == ['user2']
+        assert buffer.search_buffer_ci("missing") == []
+
+        buffer.add_message('user4', 'WORLDWIDE')
+        assert [r.author for r in buffer.search_buffer_ci("World")] == ['user1', 'user4']
+
+    def test_search_many(self):
+        """Test searching several identifiers in one pass"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('user1', 'code ABC123 here')
+        buffer.add_message('user2', 'XYZ and ABC123')
+        buffer.add_message('user3', 'nothing')
+
+        results = buffer.search_many(['ABC123', 'XYZ', 'missing'])
+        assert [r.author for r in results['ABC123']] == ['user1', 'user2']
+        assert [r.author for r in results['XYZ']] == ['user2']
+        assert results['missing'] == []
+
+    def test_search_many_no_identifiers(self):
+        """Test searching with no identifiers returns empty dict"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('user1', 'Hello')
+        assert buffer.search_many([]) == {}
+
 
 class TestSearchByUsername:
     """Test username search functionality"""
@@ -128,36 +198,20 @@ class TestSearchByUsername:
         """Test finding messages by username"""
         buffer = YouTubeChatBuffer("test_video_id")
 
-        buffer.buffer.append({
-            'author': 'testuser',
-            'message': 'Message 1',
-            'timestamp': datetime.now()
-        })
-        buffer.buffer.append({
-            'author': 'otheruser',
-            'message': 'Message 2',
-            'timestamp': datetime.now()
-        })
-        buffer.buffer.append({
-            'author': 'testuser',
-            'message': 'Message 3',
-            'timestamp': datetime.now()
-        })
+        buffer.add_message('testuser', 'Message 1')
+        buffer.add_message('otheruser', 'Message 2')
+        buffer.add_message('testuser', 'Message 3')
 
         results = buffer.search_by_username("testuser")
         assert len(results) == 2
-        assert results[0]['author'] == 'testuser'
-        assert results[1]['author'] == 'testuser'
+        assert results[0].author == 'testuser'
+        assert results[1].author == 'testuser'
 
     def test_search_by_username_case_insensitive(self):
         """Test username search is case-insensitive"""
         buffer = YouTubeChatBuffer("test_video_id")
 
-        buffer.buffer.append({
-            'author': 'TestUser',
-            'message': 'Hello',
-            'timestamp': datetime.now()
-        })
+        buffer.add_message('TestUser', 'Hello')
 
         # Should find with lowercase
         results = buffer.search_by_username("testuser")
@@ -167,6 +221,135 @@ class TestSearchByUsername:
         results = buffer.search_by_username("TESTUSER")
         assert len(results) == 1
 
+    def test_search_by_username_casefolds(self):
+        """Test usernames match under full Unicode case folding"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('Straße', 'Hallo')
+
+        assert len(buffer.search_by_username("STRASSE")) == 1
+
+    def test_search_by_username_uses_author_index(self):
+        """Test author index lookups return the most recent message first"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('TestUser', 'First')
+        buffer.add_message('other', 'Noise')
+        buffer.add_message('testuser', 'Second')
+
+        assert len(buffer.by_author['testuser']) == 2
+        results = buffer.search_by_username(" TestUser ")
+        assert [r.message for r in results] == ['Second', 'First']
+        assert buffer.search_by_username("nobody") == []
+
+    def test_match_usernames_by_prefix(self):
+        """Test prefix lookup over the sorted author names"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        for name in ['Bob', 'alice', 'Alicia', 'al', 'carol']:
+            buffer.add_message(name, 'hi')
+
+        assert buffer.match_usernames('ALI') == ['alice', 'alicia']
+        assert buffer.match_usernames('al') == ['al', 'alice', 'alicia']
+        assert buffer.match_usernames('z') == []
+
+    def test_add_message_caches_lowercase_author(self):
+        """Test lowercased author is stored once at insertion"""
+        buffer = YouTubeChatBuffer("test_video_id")
+        buffer.add_message('TestUser', 'Hello')
+
+        msg = buffer.buffer[0]
+        assert msg.author == 'TestUser'
+        assert msg.author_lower == 'testuser'
+
+
+class FakeAuthor:
+    """Stand-in for a pytchat chat item author"""
+
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeMessage:
+    """Stand-in for a pytchat chat item"""
+
+    def __init__(self, author, message):
+        self.author = FakeAuthor(author)
+        self.message = message
+
+
+class OneShotChat:
+    """Fake pytchat chat that serves a single fetch, then reports the stream ended"""
+
+    def __init__(self, sync_items):
+        self.sync_items = sync_items  # Generator function yielding the fetch's FakeMessages
+        self.alive = True
+
+    def is_alive(self):
+        return self.alive
+
+    def get(self):
+        # The buffer only calls sync_items() on the fetched data
+        self.alive = False
+        return self
+
+    def terminate(self):
+        pass
+
+
+class TestBufferLoop:
+    """Test the background fetch loop with a fake chat object"""
+
+    def test_buffer_loop_stores_fetched_messages(self):
+        """Test every fetched message is stored and @ is stripped"""
+        def sync_items():
+            yield FakeMessage('@Alice', 'hi')
+            yield FakeMessage('Bob', 'hello')
+
+        buffer = YouTubeChatBuffer("test_video_id")
+        assert buffer.start_buffering(chat_object=OneShotChat(sync_items))
+        buffer.worker_thread.join(timeout=5.0)
+
+        assert buffer.is_stream_ended()
+        assert buffer.get_buffer_stats()['message_count'] == 2
+        assert [r.message for r in buffer.search_by_username('alice')] == ['hi']
+
+    def test_buffer_loop_stores_each_message_as_yielded(self):
+        """Test a message is searchable before the rest of its fetch is paced out"""
+        first_stored = threading.Event()
+        release = threading.Event()
+
+        def sync_items():
+            yield FakeMessage('Alice', 'hi')
+            first_stored.set()
+            release.wait(timeout=5)  # Stands in for pytchat's pacing sleep
+            yield FakeMessage('Bob', 'hello')
+
+        buffer = YouTubeChatBuffer("test_video_id")
+        assert buffer.start_buffering(chat_object=OneShotChat(sync_items))
+        assert first_stored.wait(timeout=5)
+        assert [r.message for r in buffer.search_by_username('alice')] == ['hi']
+
+        release.set()
+        buffer.worker_thread.join(timeout=5.0)
+        assert buffer.get_buffer_stats()['message_count'] == 2
+
+
+class TestPollInterval:
+    """Test adaptive chat polling interval"""
+
+    def test_idle_backs_off_up_to_cap(self):
+        """Test empty fetches grow the interval but never past the cap"""
+        interval = 0.5
+        for _ in range(10):
+            interval = _next_poll_interval(0, interval)
+        assert interval == MAX_POLL_INTERVAL
+
+    def test_small_batch_polls_quickly(self):
+        """Test a trickle of messages shortens the interval"""
+        assert _next_poll_interval(2, MAX_POLL_INTERVAL) == 0.25
+
+    def test_large_batch_polls_slower(self):
+        """Test a steady stream lets batches accumulate"""
+        assert _next_poll_interval(25, 0.25) == 1.0
+
 
 class TestErrorHandling:
     """Test error handling and status methods"""
@@ -181,6 +364,27 @@ class TestErrorHandling:
         buffer = YouTubeChatBuffer("test_video_id")
         assert buffer.get_error_message() is None
 
+    def test_stop_buffering_interrupts_backoff(self):
+        """Test stop_buffering doesn't wait out the reconnect backoff"""
+        class FailingChat:
+            def is_alive(self):
+                return True
+
+            def get(self):
+                raise ConnectionError("network down")
+
+            def terminate(self):
+                pass
+
+        buffer = YouTubeChatBuffer("test_video_id")
+        assert buffer.start_buffering(chat_object=FailingChat())
+        time.sleep(0.1)  # Let the worker enter its backoff wait
+
+        start = time.monotonic()
+        buffer.stop_buffering()
+        assert time.monotonic() - start < 0.5
+        assert not buffer.worker_thread.is_alive()
+
     def test_stop_buffering_without_start(self):
         """Test stop_buffering can be called without starting"""
         buffer = YouTubeChatBuffer("test_video_id")
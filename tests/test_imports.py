@@ -3,91 +3,43 @@ Test that all critical modules and dependencies can be imported.
 This would catch PyInstaller packaging issues like missing pytchat.
 """
 
-import pytest
-import sys
-from pathlib import Path
+import importlib
 
-# Add src to path for imports
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import pytest
 
 
 class TestCriticalImports:
     """Test all critical third-party dependencies"""
 
-    def test_import_pytchat(self):
-        """Test pytchat and its submodules can be imported"""
-        import pytchat
-        assert pytchat is not None
-
-    def test_import_pytchat_config(self):
-        """Test pytchat.config submodule"""
-        import pytchat.config
-        assert pytchat.config is not None
-
-    def test_import_pytchat_processors(self):
-        """Test pytchat.processors submodule"""
-        import pytchat.processors
-        assert pytchat.processors is not None
-
-    def test_import_pytchat_exceptions(self):
-        """Test pytchat.exceptions submodule"""
-        import pytchat.exceptions
-        assert pytchat.exceptions is not None
-
-    def test_import_httpx(self):
-        """Test httpx (pytchat dependency)"""
-        import httpx
-        assert httpx is not None
-
-    def test_import_tkinter(self):
-        """Test tkinter is available"""
-        import tkinter
-        assert tkinter is not None
-
-    def test_import_threading(self):
-        """Test threading module"""
-        import threading
-        assert threading is not None
-
-    def test_import_collections(self):
-        """Test collections module"""
-        import collections
-        assert collections is not None
-
-    def test_import_datetime(self):
-        """Test datetime module"""
-        import datetime
-        assert datetime is not None
+    @pytest.mark.parametrize('module_name', [
+        'pytchat',
+        'pytchat.config',
+        'pytchat.processors',
+        'pytchat.exceptions',
+        'httpx',  # pytchat dependency, also used directly by url_validator
+        'tkinter',
+        'threading',
+        'collections',
+        'datetime',
+    ])
+    def test_import(self, module_name):
+        """Test a dependency (or one of its submodules) can be imported"""
+        assert importlib.import_module(module_name) is not None
 
 
 class TestProjectModules:
     """Test all project modules can be imported"""
 
-    def test_import_strings(self):
-        """Test strings module"""
-        import strings
-        assert strings is not None
-
-    def test_import_url_validator(self):
-        """Test url_validator module"""
-        import url_validator
-        assert url_validator is not None
-
-    def test_import_chat_engine(self):
-        """Test chat_engine module"""
-        import chat_engine
-        assert chat_engine is not None
-
-    def test_import_ui(self):
-        """Test ui module"""
-        import ui
-        assert ui is not None
-
-    def test_import_main(self):
-        """Test main module"""
-        import main
-        assert main is not None
+    @pytest.mark.parametrize('module_name', [
+        'strings',
+        'url_validator',
+        'chat_engine',
+        'ui',
+        'main',
+    ])
+    def test_import(self, module_name):
+        """Test a project module can be imported"""
+        assert importlib.import_module(module_name) is not None
 
 
 class TestModuleFunctions:
@@ -3,12 +3,6 @@ Test that all string constants are properly defined
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
 
 import strings as S
 
@@ -209,6 +203,10 @@ class TestResultsStrings:
         assert '{count}' in S.RESULTS_FAIL_DETAILS
         assert '{seconds}' in S.RESULTS_FAIL_DETAILS
 
+    def test_results_fail_reasons(self):
+        assert hasattr(S, 'RESULTS_FAIL_REASONS')
+        assert S.RESULTS_FAIL_REASONS.startswith("Possible reasons:")
+
     def test_results_button_search_again(self):
         assert hasattr(S, 'RESULTS_BUTTON_SEARCH_AGAIN')
 
@@ -3,14 +3,13 @@ Test URL validation and parsing functionality
 """
 
 import pytest
-import sys
-from pathlib import Path
+import threading
+import time
 
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
-from url_validator import parse_youtube_url, clear_cache
+import url_validator
+from url_validator import (
+    parse_youtube_url, validate_livestream, validate_livestream_async, clear_cache, MAX_URL_LENGTH
+)
 
 
 class TestParseYouTubeURL:
@@ -74,13 +73,205 @@ class TestParseYouTubeURL:
         result = parse_youtube_url(url)
         assert result == "dQw4w9WgXcQ"
 
+    def test_parse_url_without_scheme(self):
+        """Test parsing URLs pasted without http(s)://"""
+        assert parse_youtube_url("youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert parse_youtube_url("youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+    def test_parse_url_with_v_after_other_params(self):
+        """Test the v parameter is found wherever it is in the query"""
+        url = "https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ"
+        assert parse_youtube_url(url) == "dQw4w9WgXcQ"
+
+    def test_parse_url_in_surrounding_text(self):
+        """Test a URL is found inside pasted text"""
+        assert parse_youtube_url("watch this https://youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert parse_youtube_url("live now: youtu.be/dQw4w9WgXcQ\nsee you there") == "dQw4w9WgXcQ"
+        assert parse_youtube_url("my youtube link youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+    def test_parse_lookalike_host(self):
+        """Test hosts that only end in youtube.com are rejected"""
+        assert parse_youtube_url("https://notyoutube.com/watch?v=dQw4w9WgXcQ") is None
+
+    def test_parse_partial_url(self):
+        """Test partially typed URLs are rejected"""
+        assert parse_youtube_url("https://") is None
+        assert parse_youtube_url("https://youtu.be/dQw4") is None
+
+    def test_parse_uppercase_host(self):
+        """Test the host is matched case-insensitively"""
+        assert parse_youtube_url("HTTPS://WWW.YOUTUBE.COM/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+
+    def test_parse_overlong_input(self):
+        """Test input over MAX_URL_LENGTH is rejected even if it holds a URL"""
+        url = "https://youtu.be/dQw4w9WgXcQ?pad=" + "x" * MAX_URL_LENGTH
+        assert parse_youtube_url(url) is None
+
+    def test_parse_malformed_url(self):
+        """Test URLs urlsplit cannot parse return None instead of raising"""
+        assert parse_youtube_url("https://[youtube.com/watch?v=dQw4w9WgXcQ") is None
+
 
 class TestClearCache:
     """Test cache clearing functionality"""
 
+    def test_clear_cache_empties_cache_in_place(self):
+        """Test clear_cache empties the existing cache object"""
+        cache = url_validator._validation_cache
+        url_validator._cache_put("dQw4w9WgXcQ", {'valid': True, 'live': True, 'error': None})
+        clear_cache()
+        assert url_validator._validation_cache is cache
+        assert len(cache) == 0
+
     def test_clear_cache_runs_without_error(self):
         """Test clear_cache function executes without error"""
         try:
             clear_cache()
         except Exception as e:
             pytest.fail(f"clear_cache raised exception: {e}")
+
+
+class TestValidateLivestream:
+    """Test validate_livestream results"""
+
+    def test_no_video_id(self):
+        """Test a missing video ID gets the shared read-only result"""
+        result = validate_livestream("")
+        assert result == {'valid': False, 'live': False, 'error': 'No video ID provided'}
+        assert validate_livestream(None) is result
+        with pytest.raises(TypeError):
+            result['valid'] = True
+
+    def test_known_video_is_valid(self, monkeypatch):
+        """Test a video YouTube resolves to a channel is reported as valid"""
+        from pytchat import util
+
+        monkeypatch.setattr(util, 'get_channelid', lambda client, video_id: "UCchannel")
+        clear_cache()
+        result = validate_livestream("ccccccccccc")
+        assert result['valid'] and result['live'] and result['error'] is None
+
+    def test_concurrent_checks_are_coalesced(self, monkeypatch):
+        """Test simultaneous checks of one video share a single request"""
+        from pytchat import util
+
+        calls = []
+        release = threading.Event()
+
+        def get_channelid(client, video_id):
+            calls.append(video_id)
+            release.wait(timeout=5)
+            return "UCchannel"
+
+        monkeypatch.setattr(util, 'get_channelid', get_channelid)
+        clear_cache()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(validate_livestream("ddddddddddd")))
+            for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)  # Let every thread reach the check
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert calls == ["ddddddddddd"]
+        assert len(results) == 3 and all(r is results[0] for r in results)
+        assert url_validator._inflight == {}
+
+
+class TestValidationCache:
+    """Test the bounded validation result cache"""
+
+    def setup_method(self):
+        clear_cache()
+
+    def test_cached_result_is_returned(self):
+        """Test a cached result is returned without checking the stream"""
+        result = {'valid': True, 'live': True, 'error': None}
+        url_validator._cache_put("dQw4w9WgXcQ", result)
+        assert validate_livestream("dQw4w9WgXcQ") is result
+
+    def test_cache_entries_expire(self, monkeypatch):
+        """Test entries older than the timeout are dropped on lookup"""
+        monkeypatch.setattr(url_validator, '_cache_timeout', 0)
+        url_validator._cache_put("dQw4w9WgXcQ", {'valid': True, 'live': True, 'error': None})
+        assert url_validator._cache_get("dQw4w9WgXcQ") is None
+        assert len(url_validator._validation_cache) == 0
+
+    def test_invalid_ids_are_cached_longer(self, monkeypatch):
+        """Test invalid video IDs outlive the short cache timeout"""
+        from pytchat import exceptions, util
+
+        def get_channelid(client, video_id):
+            raise exceptions.InvalidVideoIdException("bad id")
+
+        monkeypatch.setattr(util, 'get_channelid', get_channelid)
+        monkeypatch.setattr(url_validator, '_cache_timeout', 0)
+        result = validate_livestream("aaaaaaaaaaa")
+
+        assert result['error'] == 'Invalid video ID'
+        assert url_validator._cache_get("aaaaaaaaaaa") is result
+
+    def test_async_cache_hit_calls_back_immediately(self):
+        """Test a cached result reaches the callback before the call returns"""
+        result = {'valid': True, 'live': True, 'error': None}
+        url_validator._cache_put("dQw4w9WgXcQ", result)
+        received = []
+
+        future = validate_livestream_async("dQw4w9WgXcQ", received.append)
+        assert received == [result]
+        assert future.result() is result
+
+    def test_async_miss_checks_in_background(self, monkeypatch):
+        """Test an uncached check runs on the executor and calls back with its result"""
+        from pytchat import exceptions, util
+
+        def get_channelid(client, video_id):
+            raise exceptions.InvalidVideoIdException("bad id")
+
+        monkeypatch.setattr(util, 'get_channelid', get_channelid)
+        received = []
+        called = threading.Event()
+
+        def callback(result):
+            received.append(result)
+            called.set()
+
+        future = validate_livestream_async("bbbbbbbbbbb", callback)
+        assert future.result(timeout=5)['error'] == 'Invalid video ID'
+        assert called.wait(timeout=5)
+        assert received == [future.result()]
+
+    def test_async_probe_failure_still_calls_back(self, monkeypatch):
+        """Test an exception escaping the check reaches the callback as an error result"""
+        def probe(video_id):
+            raise ImportError("pytchat unavailable")
+
+        monkeypatch.setattr(url_validator, '_probe_livestream', probe)
+        received = []
+        called = threading.Event()
+
+        def callback(result):
+            received.append(result)
+            called.set()
+
+        validate_livestream_async("eeeeeeeeeee", callback)
+        assert called.wait(timeout=5)
+        assert received == [{
+            'valid': False,
+            'live': False,
+            'error': 'Validation error: pytchat unavailable'
+        }]
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test the cache never holds more than the maximum number of entries"""
+        monkeypatch.setattr(url_validator, '_cache_max_entries', 2)
+        url_validator._cache_put("aaaaaaaaaaa", {'valid': False})
+        url_validator._cache_put("bbbbbbbbbbb", {'valid': False})
+        url_validator._cache_get("aaaaaaaaaaa")  # Refresh a, so b is oldest
+        url_validator._cache_put("ccccccccccc", {'valid': False})
+
+        assert list(url_validator._validation_cache) == ["aaaaaaaaaaa", "ccccccccccc"]